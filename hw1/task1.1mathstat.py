@@ -1,31 +1,29 @@
-import json
-import math
-import random
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'hw2-4'))
 
-def generate_discrete_uniform_sample(theta, sample_size):
-    sample = []
-    for _ in range(sample_size):
-        gamma = random.uniform(0, 1)
-        mu_gamma = math.floor(gamma * theta) + 1
-        sample.append(mu_gamma)
-    return sample
+from generators import (generate_discrete_uniform_sample, sample_meta_to_json, sample_to_json,
+                        stream_sample_to_npy, CHUNK_SIZE)
 
 theta = int(input("Введите значение параметра θ: "))
 sample_size = int(input("Введите объём выборки: "))
 
-sample = generate_discrete_uniform_sample(theta, sample_size)
+if sample_size <= CHUNK_SIZE:
+    sample = generate_discrete_uniform_sample(theta, sample_size)
 
+    sample_to_json(sample, 'discrete_uniform', theta, 'discrete_uniform_sample.json')
 
-with open('discrete_uniform_sample.json', 'w') as f:
-    json.dump({
-        'distribution': 'discrete_uniform',
-        'parameter': theta,
-        'sample_size': sample_size,
-        'sample': sample
-    }, f, indent=2)
+    print(f"Сгенерирована выборка из {sample_size} значений:")
+    print(f"Параметр θ = {theta}")
+    print(f"Выборка: {sample}")
+    print("Данные сохранены в файл 'discrete_uniform_sample.json'")
+else:
+    # Потоковый режим: выборка пишется на диск блоками, в памяти не более одного блока
+    stream_sample_to_npy('discrete_uniform', theta, sample_size, 'discrete_uniform_sample.npy')
+    sample_meta_to_json('discrete_uniform', theta, sample_size, 'discrete_uniform_sample.npy',
+                        'discrete_uniform_sample.json')
 
-print(f"Сгенерирована выборка из {sample_size} значений:")
-print(f"Параметр θ = {theta}")
-print(f"Выборка: {sample}")
-print("Данные сохранены в файл 'discrete_uniform_sample.json'")
+    print(f"Сгенерирована выборка из {sample_size} значений блоками по {CHUNK_SIZE}")
+    print(f"Параметр θ = {theta}")
+    print("Выборка сохранена в файл 'discrete_uniform_sample.npy', описание — в 'discrete_uniform_sample.json'")
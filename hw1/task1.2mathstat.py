@@ -1,30 +1,29 @@
-import json
-import random
+import os
+import sys
 
-def generate_pareto_sample(theta, sample_size):
-    sample = []
-    for _ in range(sample_size):
-        gamma = random.uniform(0, 1)
-        mu_gamma = (1 - gamma) ** (-1 / theta)
-        sample.append(mu_gamma)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'hw2-4'))
 
-    return sample
+from generators import (generate_pareto_sample, sample_meta_to_json, sample_to_json,
+                        stream_sample_to_npy, CHUNK_SIZE)
 
 theta = float(input("Введите значение параметра θ: "))
 sample_size = int(input("Введите объём выборки: "))
 
-sample = generate_pareto_sample(theta, sample_size)
+if sample_size <= CHUNK_SIZE:
+    sample = generate_pareto_sample(theta, sample_size)
 
-# Сохранение в JSON файл
-with open('pareto_sample.json', 'w') as f:
-    json.dump({
-        'distribution': 'pareto',
-        'parameter': theta,
-        'sample_size': sample_size,
-        'sample': sample
-    }, f, indent=2)
+    # Сохранение в JSON файл
+    sample_to_json(sample, 'pareto', theta, 'pareto_sample.json')
 
-print(f"Сгенерирована выборка из {sample_size} значений:")
-print(f"Параметр θ = {theta}")
-print(f"Выборка: {sample}")
-print("Данные сохранены в файл 'pareto_sample.json'")
\ No newline at end of file
+    print(f"Сгенерирована выборка из {sample_size} значений:")
+    print(f"Параметр θ = {theta}")
+    print(f"Выборка: {sample}")
+    print("Данные сохранены в файл 'pareto_sample.json'")
+else:
+    # Потоковый режим: выборка пишется на диск блоками, в памяти не более одного блока
+    stream_sample_to_npy('pareto', theta, sample_size, 'pareto_sample.npy')
+    sample_meta_to_json('pareto', theta, sample_size, 'pareto_sample.npy', 'pareto_sample.json')
+
+    print(f"Сгенерирована выборка из {sample_size} значений блоками по {CHUNK_SIZE}")
+    print(f"Параметр θ = {theta}")
+    print("Выборка сохранена в файл 'pareto_sample.npy', описание — в 'pareto_sample.json'")
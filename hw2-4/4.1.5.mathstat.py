@@ -1,23 +1,16 @@
-import json
 import math
 import numpy as np
-from scipy.stats import chi2
 
-
-def load_samples(filename):
-    with open(filename, 'r') as f:
-        data = json.load(f)
-    return data
+from datasets import load_dataset
+from distributions import Pareto
+from result_cache import cached_result
+from stat_tables import chi2_critical, chi2_pvalue
 
 
 def sturges_k(n):
     return max(2, 1 + int(np.log2(n)))
 
 
-def pareto_cdf(x, theta):
-    return 1 - x ** (-theta)
-
-
 def create_intervals_pareto(sample, k, theta):
     sorted_sample = sorted(sample)
     min_val = 1.0
@@ -25,15 +18,13 @@ def create_intervals_pareto(sample, k, theta):
 
     probs = np.linspace(0, 1, k + 1)[1:-1]
     boundaries = [min_val]
-    for p in probs:
-        boundary = (1 - p) ** (-1 / theta)
-        boundaries.append(boundary)
+    boundaries.extend(Pareto(theta).ppf(probs))
     boundaries.append(max_val)
 
     return boundaries
 
 
-def chi2_complex_pareto(sample):
+def chi2_complex_pareto(sample, alpha=0.05):
     n = len(sample)
 
     theta_est = n / sum(math.log(x) for x in sample)
@@ -51,10 +42,7 @@ def chi2_complex_pareto(sample):
         if value >= boundaries[-1]:
             observed[-1] += 1
 
-    expected = np.zeros(k)
-    for i in range(k):
-        prob = pareto_cdf(boundaries[i + 1], theta_est) - pareto_cdf(boundaries[i], theta_est)
-        expected[i] = n * prob
+    expected = n * np.diff(Pareto(theta_est).cdf(boundaries))
 
     chi2_val = 0
     for obs, exp in zip(observed, expected):
@@ -62,25 +50,26 @@ def chi2_complex_pareto(sample):
             chi2_val += (obs - exp) ** 2 / exp
 
     df = k - 2
-    critical_value = chi2.ppf(0.95, df)
+    critical_value = chi2_critical(df, alpha)
+    p_value = chi2_pvalue(chi2_val, df)
 
-    return chi2_val, critical_value, k, theta_est
+    return chi2_val, critical_value, p_value, k, theta_est
 
 
-def main():
-    data = load_samples('pareto_series.json')
-    sample_sizes = data['sample_sizes']
-    series = data['series']
+@cached_result
+def compute_results(name, alpha):
+    data = load_dataset(name)
+    sample_sizes = data.sample_sizes
 
     results = []
     theta_estimates = {}
 
     for size in sample_sizes:
         size_theta_estimates = []
-        for series_idx, series_data in enumerate(series):
-            sample = series_data['samples'][str(size)]
+        for series_idx in range(data.num_series):
+            sample = data.sample(series_idx, size)
 
-            chi2_val, critical_value, k, theta_est = chi2_complex_pareto(sample)
+            chi2_val, critical_value, p_value, k, theta_est = chi2_complex_pareto(sample, alpha)
 
             conclusion = "Отвергаем" if chi2_val > critical_value else "Принимаем"
 
@@ -91,6 +80,7 @@ def main():
                 'θ_est': round(theta_est, 4),
                 'χ2': round(chi2_val, 2),
                 'Критическое': round(critical_value, 2),
+                'p': p_value,
                 'df': k - 2,
                 'Вывод': conclusion
             })
@@ -98,12 +88,20 @@ def main():
             size_theta_estimates.append(theta_est)
 
         theta_estimates[size] = np.mean(size_theta_estimates)
+    return results, theta_estimates
+
+
+def main():
+    data = load_dataset('pareto')
+    sample_sizes = data.sample_sizes
+
+    results, theta_estimates = compute_results('pareto', 0.05)
 
-    print("n\tСерия\tk\tθ_est\tχ2\t\tКрит.зн.\tdf\tВывод")
+    print("n\tСерия\tk\tθ_est\tχ2\t\tКрит.зн.\tp-значение\tdf\tВывод")
     print("-" * 80)
     for res in results:
         print(
-            f"{res['n']}\t{res['Серия']}\t{res['k']}\t{res['θ_est']}\t{res['χ2']:8.2f}\t{res['Критическое']:8.2f}\t{res['df']}\t{res['Вывод']}")
+            f"{res['n']}\t{res['Серия']}\t{res['k']}\t{res['θ_est']}\t{res['χ2']:8.2f}\t{res['Критическое']:8.2f}\t{res['p']:10.4f}\t{res['df']}\t{res['Вывод']}")
 
     print("\nСредние оценки θ по объему выборки:")
     print("n\tСреднее θ")
@@ -0,0 +1,159 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from datasets import DATASETS, load_dataset
+from estimators import ESTIMATORS, discrete_uniform_kernels, estimate_matrix, leave_one_out, pareto_kernels
+from frequencies import DiscreteFrequencies
+
+# элементов индексной матрицы в одном блоке бутстрепа
+BLOCK_ELEMENTS = 2 ** 22
+
+
+def _sufficient_data(distribution, sample):
+    # дискретный случай: только различные значения и их частоты, выборка не нужна
+    if distribution == 'discrete_uniform':
+        counts = DiscreteFrequencies(sample, int(np.max(sample))).counts
+        values = np.flatnonzero(counts) + 1
+        return values, counts[values - 1]
+    sample = np.asarray(sample, dtype=np.float64)
+    return sample, np.log(sample)
+
+
+def _resample_block(distribution, data, n, block_size, rng):
+    if distribution == 'discrete_uniform':
+        values, counts = data
+        # повторная выборка = мультиномиальные частоты: O(B·k) вместо O(B·n)
+        resampled = rng.multinomial(n, counts / n, size=block_size)
+        mean = resampled @ values / n
+        last_present = len(values) - 1 - np.argmax(resampled[:, ::-1] > 0, axis=1)
+        return discrete_uniform_kernels(mean, values[last_present], n)
+
+    sample, log_sample = data
+    indices = rng.integers(0, n, size=(block_size, n))
+    mean = sample[indices].mean(axis=1)
+    log_sum = log_sample[indices].sum(axis=1)
+    return pareto_kernels(mean, log_sum, n)
+
+
+def _run_blocks(args):
+    distribution, data, n, block_sizes, seeds = args
+    results = {name: [] for name in ESTIMATORS}
+    for block_size, seed in zip(block_sizes, seeds):
+        estimates = _resample_block(distribution, data, n, block_size, np.random.default_rng(seed))
+        for name in ESTIMATORS:
+            results[name].append(estimates[name])
+    return {name: np.concatenate(values) for name, values in results.items()}
+
+
+def bootstrap_estimates(distribution, sample, resamples=10 ** 4, seed=None, workers=None):
+    n = len(sample)
+    data = _sufficient_data(distribution, sample)
+    block_size = max(1, BLOCK_ELEMENTS // n)
+    block_sizes = [min(block_size, resamples - start) for start in range(0, resamples, block_size)]
+    # у каждого блока свой seed: результат не зависит от числа процессов
+    seeds = np.random.SeedSequence(seed).spawn(len(block_sizes))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(block_sizes))
+    # процесс получает выборку один раз и обрабатывает подряд идущую группу блоков
+    groups = np.array_split(np.arange(len(block_sizes)), workers)
+    tasks = [(distribution, data, n, [block_sizes[i] for i in group], [seeds[i] for i in group])
+             for group in groups]
+    if workers <= 1:
+        parts = [_run_blocks(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_run_blocks, tasks))
+    return {name: np.concatenate([part[name] for part in parts]) for name in ESTIMATORS}
+
+
+def _jackknife_acceleration(distribution, sample):
+    # ускорение BCa по оценкам без одного наблюдения; для дискретного случая — по
+    # различным значениям с весами-частотами, для Парето — по каждому наблюдению
+    n = len(sample)
+    if distribution == 'discrete_uniform':
+        values, weights = _sufficient_data(distribution, sample)
+        total = values @ weights
+        x_max = values[-1]
+        second = values[-2] if len(values) > 1 else x_max
+        loo_max = np.where((values == x_max) & (weights == 1), second, x_max)
+        estimates = discrete_uniform_kernels((total - values) / (n - 1), loo_max, n - 1)
+    else:
+        weights = np.ones(n)
+        estimates = leave_one_out(distribution, sample)
+
+    acceleration = {}
+    for name in ESTIMATORS:
+        jack = estimates[name]
+        d = np.average(jack, weights=weights) - jack
+        denominator = 6 * np.sum(weights * d ** 2) ** 1.5
+        acceleration[name] = np.sum(weights * d ** 3) / denominator if denominator > 0 else 0.0
+    return acceleration
+
+
+def bootstrap_intervals(distribution, sample, point_estimates, resamples=10 ** 4, alpha=0.05, seed=None, workers=None):
+    boot = bootstrap_estimates(distribution, sample, resamples, seed, workers)
+    acceleration = _jackknife_acceleration(distribution, sample)
+    normal = NormalDist()
+    intervals = {}
+    for name in ESTIMATORS:
+        estimate = point_estimates[name]
+        values = boot[name][np.isfinite(boot[name])]
+        if len(values) == 0 or not np.isfinite(estimate):
+            intervals[name] = {'percentile': (np.nan, np.nan), 'bca': (np.nan, np.nan)}
+            continue
+        percentile = tuple(np.quantile(values, [alpha / 2, 1 - alpha / 2]))
+
+        # поправка на смещение: совпадения с оценкой (дискретный максимум) делим пополам
+        below = np.mean(values < estimate) + 0.5 * np.mean(values == estimate)
+        if 0 < below < 1:
+            z0 = normal.inv_cdf(below)
+            a = acceleration[name]
+            levels = []
+            for z_alpha in (normal.inv_cdf(alpha / 2), normal.inv_cdf(1 - alpha / 2)):
+                shifted = z0 + z_alpha
+                levels.append(normal.cdf(z0 + shifted / (1 - a * shifted)))
+            bca = tuple(np.quantile(values, levels))
+        else:
+            bca = (np.nan, np.nan)
+        intervals[name] = {'percentile': percentile, 'bca': bca}
+    return intervals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бутстреп-интервалы для оценок θ (к заданиям 3.1-3.2)")
+    parser.add_argument('--datasets', nargs='+', default=list(DATASETS))
+    parser.add_argument('--series', type=int, default=1, help="номер серии")
+    parser.add_argument('--size', type=int, default=None, help="объём выборки (по умолчанию наибольший)")
+    parser.add_argument('--resamples', type=int, default=10 ** 4)
+    parser.add_argument('--alpha', type=float, default=0.05)
+    parser.add_argument('--seed', type=int, default=2024)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    for name in args.datasets:
+        data = load_dataset(name)
+        size = args.size or max(data.sample_sizes)
+        if size > max(data.sample_sizes):
+            parser.error(f"в серии только {max(data.sample_sizes)} наблюдений")
+        sample = data.sample(args.series - 1, size)
+        point = {estimator: values[0, 0]
+                 for estimator, values in estimate_matrix(data.distribution, sample[None, :], [size]).items()}
+        intervals = bootstrap_intervals(data.distribution, sample, point, args.resamples, args.alpha,
+                                        args.seed, args.workers)
+
+        print(f"\n{data.distribution}: θ = {data.theta}, серия {args.series}, n = {size}, B = {args.resamples}")
+        print(f"{'оценка':>7} {'θ̂':>12} {'перцентильный':>28} {'BCa':>28}")
+        for estimator in ESTIMATORS:
+            low, high = intervals[estimator]['percentile']
+            bca_low, bca_high = intervals[estimator]['bca']
+            print(f"{estimator:>7} {point[estimator]:12.6f}   [{low:11.6f}, {high:11.6f}]   [{bca_low:11.6f}, {bca_high:11.6f}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+
+from sample_store import fresh_store_for, load_series, open_series_store, save_series_store, series_from_json
+
+DATASETS = {
+    'discrete_uniform': 'discrete_uniform_series.json',
+    'pareto': 'pareto_series.json',
+}
+
+CACHE_DIR = '.cache'
+
+# кэш процесса: путь -> (источник, отметки (mtime_ns, размер) его файлов, SeriesSet)
+_loaded = {}
+
+
+def dataset_path(name):
+    return DATASETS.get(name, name)
+
+
+def dataset_source(name):
+    # то, что на самом деле открывает load_dataset: свежий .store рядом с JSON, каталог или сам файл
+    path = os.path.abspath(dataset_path(name))
+    if not os.path.isdir(path) and path.endswith('.json'):
+        store_path = fresh_store_for(path)
+        if store_path is not None:
+            return os.path.abspath(store_path)
+    return path
+
+
+def _source_files(source):
+    if os.path.isdir(source):
+        return [os.path.join(source, 'series.npy'), os.path.join(source, 'meta.json')]
+    return [source]
+
+
+def _source_stamp(source):
+    stamps = []
+    for path in _source_files(source):
+        stat = os.stat(path)
+        stamps.append((stat.st_mtime_ns, stat.st_size))
+    return stamps
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(2 ** 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _cache_dir(path):
+    return os.path.join(os.path.dirname(os.path.abspath(path)), CACHE_DIR)
+
+
+def _read_index(cache_dir):
+    # отсутствующий или испорченный индекс считается пустым: хэши просто пересчитаются
+    try:
+        with open(os.path.join(cache_dir, 'index.json'), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_index(cache_dir, index):
+    # запись во временный файл и os.replace: читатели не видят наполовину записанный индекс
+    os.makedirs(cache_dir, exist_ok=True)
+    index_path = os.path.join(cache_dir, 'index.json')
+    temp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(index, f, indent=2)
+    os.replace(temp_path, index_path)
+
+
+def _indexed_hash(path, cache_dir):
+    stat = os.stat(path)
+    index = _read_index(cache_dir)
+    entry = index.get(path)
+    # хэш пересчитывается, только если файл менялся по mtime или размеру
+    if entry is None or entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+        entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': file_hash(path)}
+        index[path] = entry
+        _write_index(cache_dir, index)
+    return entry['sha256']
+
+
+def dataset_hash(name):
+    # хэш именно тех файлов, из которых читаются данные: для хранилища — series.npy и meta.json
+    source = dataset_source(name)
+    cache_dir = _cache_dir(source)
+    files = _source_files(source)
+    if len(files) == 1:
+        return _indexed_hash(files[0], cache_dir)
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(_indexed_hash(path, cache_dir).encode())
+    return digest.hexdigest()
+
+
+def _load_uncached(path):
+    if os.path.isdir(path) or not path.endswith('.json'):
+        return load_series(path)
+
+    # разобранная форма лежит в .cache/<имя>-<sha256>.store и живёт, пока не изменилось содержимое
+    cache_dir = _cache_dir(path)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    store_path = os.path.join(cache_dir, f"{stem}-{_indexed_hash(path, cache_dir)[:16]}.store")
+    if not os.path.exists(os.path.join(store_path, 'meta.json')):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        save_series_store(series_from_json(data), store_path, overwrite=False)
+        _remove_stale_stores(cache_dir, stem, store_path)
+    return open_series_store(store_path)
+
+
+def _remove_stale_stores(cache_dir, stem, current_path):
+    # копии прежних версий того же файла больше не нужны; временные каталоги не трогаем
+    pattern = re.compile(re.escape(stem) + r'-[0-9a-f]{16}\.store')
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if pattern.fullmatch(name) and path != current_path:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def load_dataset(name):
+    path = os.path.abspath(dataset_path(name))
+    source = dataset_source(name)
+    stamp = _source_stamp(source)
+    cached = _loaded.get(path)
+    if cached is not None and cached[0] == source and cached[1] == stamp:
+        return cached[2]
+
+    series_set = _load_uncached(source)
+    _loaded[path] = (source, stamp, series_set)
+    return series_set
+
+
+def get_sample(name, series_idx, size):
+    return load_dataset(name).sample(series_idx, size)
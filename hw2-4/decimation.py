@@ -0,0 +1,35 @@
+import numpy as np
+
+# ниже этого числа точек на пиксель прореживать не нужно
+MIN_POINTS_PER_PIXEL = 4
+
+
+def decimate_indices(x, deviations=(), num_pixels=1200):
+    # x отсортирован; точки делятся на num_pixels столбцов по оси x, в каждом остаются
+    # первая и последняя точки и экстремумы каждого ряда отклонений — максимальный
+    # разрыв между эмпирической и теоретической кривыми не теряется
+    x = np.asarray(x)
+    n = len(x)
+    if n <= MIN_POINTS_PER_PIXEL * num_pixels:
+        return np.arange(n)
+
+    span = x[-1] - x[0]
+    if span > 0:
+        buckets = np.minimum(((x - x[0]) / span * num_pixels).astype(np.int64), num_pixels - 1)
+    else:
+        buckets = np.zeros(n, dtype=np.int64)
+
+    starts = np.flatnonzero(np.diff(buckets, prepend=-1))
+    ends = np.append(starts[1:], n) - 1
+    keep = [starts, ends]
+    for deviation in deviations:
+        deviation = np.asarray(deviation)
+        # внутри столбца сортировка по отклонению: последняя точка группы — максимум, первая — минимум
+        order = np.lexsort((deviation, buckets))
+        keep.append(order[starts])
+        keep.append(order[ends])
+    return np.unique(np.concatenate(keep))
+
+
+def pixel_grid(x, num_pixels=1200):
+    return np.linspace(x[0], x[-1], num_pixels)
@@ -0,0 +1,73 @@
+import numpy as np
+
+from generators import generate_matrix
+
+# функция распределения везде в смысле курса: F(t) = P(X < t)
+
+
+class DiscreteUniform:
+    name = 'discrete_uniform'
+    discrete = True
+
+    def __init__(self, theta):
+        self.theta = theta
+
+    def cdf(self, t):
+        t = np.asarray(t, dtype=np.float64)
+        return np.clip(np.ceil(t) - 1, 0, self.theta) / self.theta
+
+    def ppf(self, u):
+        u = np.asarray(u, dtype=np.float64)
+        return np.floor(u * self.theta) + 1
+
+    def pmf(self, t):
+        t = np.asarray(t, dtype=np.float64)
+        inside = (t >= 1) & (t <= self.theta) & (t == np.floor(t))
+        return np.where(inside, 1 / self.theta, 0.0)
+
+    pdf = pmf
+
+    def support(self):
+        return np.arange(1, self.theta + 1)
+
+    def sample(self, num_series, max_n, rng=None, dtype=None):
+        return generate_matrix(self.name, self.theta, num_series, max_n, rng, dtype)
+
+
+class Pareto:
+    name = 'pareto'
+    discrete = False
+
+    def __init__(self, theta):
+        self.theta = theta
+
+    def cdf(self, t):
+        t = np.asarray(t, dtype=np.float64)
+        return np.where(t > 1, 1 - np.maximum(t, 1.0) ** (-self.theta), 0.0)
+
+    def ppf(self, u):
+        u = np.asarray(u, dtype=np.float64)
+        return (1 - u) ** (-1 / self.theta)
+
+    def pdf(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        return np.where(x >= 1, self.theta * np.maximum(x, 1.0) ** (-(self.theta + 1)), 0.0)
+
+    def sample(self, num_series, max_n, rng=None, dtype=None):
+        return generate_matrix(self.name, self.theta, num_series, max_n, rng, dtype)
+
+
+DISTRIBUTIONS = {
+    DiscreteUniform.name: DiscreteUniform,
+    Pareto.name: Pareto,
+}
+
+
+def get_distribution(name, theta):
+    if name not in DISTRIBUTIONS:
+        raise ValueError(f"Неизвестное распределение: {name}")
+    return DISTRIBUTIONS[name](theta)
+
+
+def distribution_of(series_set):
+    return get_distribution(series_set.distribution, series_set.theta)
@@ -0,0 +1,58 @@
+import numpy as np
+
+
+class ECDF:
+    # одна сортировка при построении, дальше F_n(t) = #{x < t} / n через searchsorted;
+    # с весами F(t) — сумма весов наблюдений меньше t
+    def __init__(self, sample, weights=None):
+        sample = np.asarray(sample)
+        if weights is None:
+            self.sorted_sample = np.sort(sample)
+            self.cum_weights = None
+        else:
+            order = np.argsort(sample, kind='stable')
+            self.sorted_sample = sample[order]
+            weights = np.asarray(weights, dtype=np.float64)[order]
+            self.cum_weights = np.concatenate(([0.0], np.cumsum(weights) / weights.sum()))
+        self.n = len(self.sorted_sample)
+
+    def __call__(self, t):
+        counts = self.counts_below(t)
+        if self.cum_weights is None:
+            return counts / self.n
+        return self.cum_weights[counts]
+
+    def counts_below(self, t):
+        return np.searchsorted(self.sorted_sample, t, side='left')
+
+    def increments(self):
+        # скачок F в каждой точке отсортированной выборки
+        if self.cum_weights is None:
+            return np.full(self.n, 1 / self.n)
+        return np.diff(self.cum_weights)
+
+    def steps(self):
+        # точки скачков и значения F справа от каждой из них
+        values = np.unique(self.sorted_sample)
+        right = np.searchsorted(self.sorted_sample, values, side='right')
+        if self.cum_weights is None:
+            return values, right / self.n
+        return values, self.cum_weights[right]
+
+
+def pooled_ecdf(samples):
+    # среднее k эмпирических ФР — это ФР объединённой выборки, где наблюдение
+    # из выборки объёма n_i имеет вес 1 / (k * n_i); при равных n_i веса не нужны
+    if isinstance(samples, np.ndarray) and samples.ndim == 2:
+        return ECDF(samples.ravel())
+
+    samples = [np.asarray(sample) for sample in samples]
+    sizes = [len(sample) for sample in samples]
+    if len(set(sizes)) == 1:
+        return ECDF(np.concatenate(samples))
+    weights = np.concatenate([np.full(size, 1 / size) for size in sizes])
+    return ECDF(np.concatenate(samples), weights)
+
+
+def averaged_ecdf_at(samples, t):
+    return pooled_ecdf(samples)(np.asarray(t))
@@ -0,0 +1,47 @@
+import argparse
+import os
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+
+from datasets import DATASETS, load_dataset
+from estimators import ESTIMATORS, estimator_trajectories, save_trajectories
+from plotting import plot_estimator_trajectories
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Траектории оценок θ для всех n = 1..N (продолжение заданий 3.1-3.2)")
+    parser.add_argument('--datasets', nargs='+', default=list(DATASETS), help="наборы данных или пути к файлам серий")
+    parser.add_argument('--out', default='trajectories', help="каталог для .npz и рисунков")
+    parser.add_argument('--plot', action='store_true', help="сохранить рисунок для каждой серии")
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    for name in args.datasets:
+        data = load_dataset(name)
+        sizes, trajectories = estimator_trajectories(data.distribution, data.prefix(data.matrix.shape[1]))
+        stem = os.path.join(args.out, f"{data.distribution}_trajectories")
+        save_trajectories(stem + '.npz', sizes, trajectories, data.theta)
+
+        print(f"\n{data.distribution}: θ = {data.theta}, N = {sizes[-1]}, серий: {data.num_series}")
+        print(f"{'n':>8}" + "".join(f"{'θ_' + estimator:>14}" for estimator in ESTIMATORS))
+        for size in data.sample_sizes:
+            # среднее по сериям в точке n
+            row = "".join(f"{trajectories[estimator][:, size - 1].mean():14.6f}" for estimator in ESTIMATORS)
+            print(f"{size:>8}{row}")
+        print(f"Траектории сохранены в файл '{stem}.npz'")
+
+        if args.plot:
+            for series_idx in range(data.num_series):
+                series_trajectories = {estimator: values[series_idx] for estimator, values in trajectories.items()}
+                fig = plot_estimator_trajectories(sizes, series_trajectories, data.theta,
+                                                  f'Траектории оценок θ, {data.distribution}, серия {series_idx + 1}')
+                fig.savefig(f"{stem}_series{series_idx + 1}.png")
+                plt.close(fig)
+
+
+if __name__ == "__main__":
+    main()
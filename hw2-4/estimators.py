@@ -0,0 +1,114 @@
+import numpy as np
+
+from moments import prefix_accumulate
+
+ESTIMATORS = ('MM', 'MLE', 'UMVU')
+
+
+def discrete_uniform_umvu(x_max, n):
+    # (X^{n+1} - (X-1)^{n+1}) / (X^n - (X-1)^n) = X (1 - r^{n+1}) / (1 - r^n), r = (X-1)/X:
+    # без возведения X_max в степень n + 1 устойчива при любом n, при X_max = 1 сразу даёт 1
+    x_max = np.asarray(x_max, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        log_r = np.log((x_max - 1) / x_max)
+    exact = x_max * np.expm1((n + 1) * log_r) / np.expm1(n * log_r)
+    return np.where(x_max == 1, 1.0, exact)
+
+
+def discrete_uniform_kernels(mean, x_max, n):
+    return {
+        'MM': 2 * mean - 1,
+        'MLE': np.asarray(x_max, dtype=np.float64),
+        'UMVU': discrete_uniform_umvu(x_max, n),
+    }
+
+
+def pareto_kernels(mean, log_sum, n):
+    # там, где оценка не существует (X̄ <= 1, сумма логарифмов <= 0, n <= 1), стоит NaN
+    mean = np.asarray(mean, dtype=np.float64)
+    log_sum = np.asarray(log_sum, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        theta_mm = np.where(mean > 1, mean / (mean - 1), np.nan)
+        theta_mle = np.where(log_sum > 0, n / log_sum, np.nan)
+        theta_umvu = np.where((log_sum > 0) & (n > 1), (n - 1) / log_sum, np.nan)
+    return {'MM': theta_mm, 'MLE': theta_mle, 'UMVU': theta_umvu}
+
+
+def estimate_matrix(distribution, matrix, sizes):
+    # оценки для каждой клетки (серия × объём): строка матрицы — серия, объём — длина префикса
+    sizes = np.asarray(sizes)
+    sums = prefix_accumulate(matrix, sizes, transform=lambda block: block.astype(np.float64))
+    mean = sums / sizes
+    if distribution == 'discrete_uniform':
+        x_max = prefix_accumulate(matrix, sizes, np.maximum)
+        return discrete_uniform_kernels(mean, x_max, sizes)
+    if distribution == 'pareto':
+        # логарифмы суммируются в float64 и при хранении выборки во float32
+        log_sum = prefix_accumulate(matrix, sizes, transform=lambda block: np.log(block, dtype=np.float64))
+        return pareto_kernels(mean, log_sum, sizes)
+    raise ValueError(f"Неизвестное распределение: {distribution}")
+
+
+def estimate_series_set(series_set):
+    return estimate_matrix(series_set.distribution, series_set.prefix(max(series_set.sample_sizes)),
+                           series_set.sample_sizes)
+
+
+def leave_one_out(distribution, sample):
+    # оценки без i-го наблюдения для всех i сразу (по последней оси): сумма и сумма логарифмов —
+    # полные суммы минус x_i, максимум — по двум верхним порядковым статистикам
+    sample = np.asarray(sample)
+    n = sample.shape[-1]
+    if n < 2:
+        raise ValueError("Для оценок без одного наблюдения нужно хотя бы два наблюдения")
+    values = sample.astype(np.float64)
+    mean = (values.sum(axis=-1, keepdims=True) - values) / (n - 1)
+    if distribution == 'discrete_uniform':
+        # при повторяющемся максимуме вторая статистика совпадает с первой
+        top_two = np.partition(values, n - 2, axis=-1)[..., n - 2:]
+        x_max = np.where(values == top_two[..., 1:], top_two[..., :1], top_two[..., 1:])
+        return discrete_uniform_kernels(mean, x_max, n - 1)
+    if distribution == 'pareto':
+        logs = np.log(values)
+        return pareto_kernels(mean, logs.sum(axis=-1, keepdims=True) - logs, n - 1)
+    raise ValueError(f"Неизвестное распределение: {distribution}")
+
+
+def jackknife_matrix(distribution, matrix, sizes):
+    # для каждой клетки (серия × объём): оценка с поправкой на смещение n θ̂ - (n - 1) θ̄_(·)
+    # и дисперсия (n - 1) / n Σ (θ̂_(i) - θ̄_(·))²; каждый префикс — один линейный проход
+    matrix = np.asarray(matrix)
+    estimates = estimate_matrix(distribution, matrix, sizes)
+    corrected = {name: np.empty_like(values) for name, values in estimates.items()}
+    variance = {name: np.empty_like(values) for name, values in estimates.items()}
+    for size_idx, n in enumerate(sizes):
+        omitted = leave_one_out(distribution, matrix[..., :n])
+        for name in ESTIMATORS:
+            jack_mean = omitted[name].mean(axis=-1)
+            deviations = omitted[name] - jack_mean[..., None]
+            corrected[name][..., size_idx] = n * estimates[name][..., size_idx] - (n - 1) * jack_mean
+            variance[name][..., size_idx] = (n - 1) / n * (deviations * deviations).sum(axis=-1)
+    return corrected, variance
+
+
+def jackknife_series_set(series_set):
+    return jackknife_matrix(series_set.distribution, series_set.prefix(max(series_set.sample_sizes)),
+                            series_set.sample_sizes)
+
+
+def estimator_trajectories(distribution, series):
+    # θ_MM, θ_MLE, θ_UMVU для каждого префикса n = 1..N: накопленные сумма, максимум
+    # и сумма логарифмов за один проход по серии (или по каждой строке матрицы)
+    sizes = np.arange(1, np.shape(series)[-1] + 1)
+    return sizes, estimate_matrix(distribution, series, sizes)
+
+
+def save_trajectories(filename, sizes, trajectories, theta):
+    np.savez_compressed(filename, n=sizes, theta=theta, **trajectories)
+
+
+def load_trajectories(filename):
+    with np.load(filename) as data:
+        return data['n'], {name: data[name] for name in ESTIMATORS}, float(data['theta'])
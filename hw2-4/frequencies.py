@@ -0,0 +1,41 @@
+import numpy as np
+
+
+class DiscreteFrequencies:
+    # частоты значений 1..θ одним проходом np.bincount; для матрицы (серии × n) — по строкам
+    def __init__(self, sample, theta):
+        sample = np.asarray(sample)
+        self.theta = int(theta)
+        self.n = sample.shape[-1]
+        width = self.theta + 1
+        # значения вне 1..θ уходят в нулевую ячейку и не считаются
+        sample = np.where(sample <= self.theta, sample, 0)
+        if sample.ndim == 1:
+            self.counts = np.bincount(sample, minlength=width)[1:]
+        else:
+            # сдвигаем значения каждой строки в свой диапазон, чтобы хватило одного bincount
+            rows = sample.reshape(-1, self.n)
+            offsets = np.arange(len(rows))[:, None] * width
+            flat = np.bincount((rows.astype(np.int64) + offsets).ravel(), minlength=len(rows) * width)
+            self.counts = flat.reshape(len(rows), width)[:, 1:].reshape(sample.shape[:-1] + (self.theta,))
+
+    def relative(self):
+        return self.counts / self.n
+
+    def cumulative(self):
+        # C(t) = #{x <= t}, t = 1..θ
+        return np.cumsum(self.counts, axis=-1)
+
+    def ecdf(self):
+        # F_n(t) = #{x < t} / n в точках t = 1..θ
+        below = self.cumulative() - self.counts
+        return below / self.n
+
+    def interval_counts(self, intervals):
+        # число наблюдений в каждом [low, high] как разность накопленных частот
+        lows, highs = np.array(intervals).T
+        cumulative = self.cumulative()
+        padded = np.concatenate((np.zeros(cumulative.shape[:-1] + (1,), dtype=cumulative.dtype), cumulative), axis=-1)
+        highs = np.clip(highs, 0, self.theta)
+        lows = np.clip(lows - 1, 0, self.theta)
+        return np.maximum(padded[..., highs] - padded[..., lows], 0)
@@ -0,0 +1,112 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from sample_store import SeriesSet, sample_dtype, save_series_json, save_series_store, store_path_for
+
+# размер блока при потоковой генерации: пиковая память ~ CHUNK_SIZE * itemsize байт
+CHUNK_SIZE = 2 ** 20
+
+
+def generate_discrete_uniform_matrix(theta, num_series, max_n, rng=None, dtype=None):
+    rng = np.random.default_rng(rng)
+    # целочисленный розыгрыш вместо floor(gamma * theta) + 1: без ошибок округления
+    return rng.integers(1, theta, size=(num_series, max_n), endpoint=True,
+                        dtype=sample_dtype('discrete_uniform', theta, dtype))
+
+
+def generate_pareto_matrix(theta, num_series, max_n, rng=None, dtype=None):
+    rng = np.random.default_rng(rng)
+    # метод обратной функции: X = (1 - gamma) ** (-1 / theta), всё на месте
+    sample = rng.random((num_series, max_n), dtype=sample_dtype('pareto', theta, dtype))
+    np.subtract(1.0, sample, out=sample)
+    np.power(sample, -1 / theta, out=sample)
+    return sample
+
+
+GENERATORS = {
+    'discrete_uniform': generate_discrete_uniform_matrix,
+    'pareto': generate_pareto_matrix,
+}
+
+
+def generate_matrix(distribution, theta, num_series, max_n, rng=None, dtype=None):
+    return GENERATORS[distribution](theta, num_series, max_n, rng, dtype)
+
+
+def _generate_series(args):
+    distribution, theta, max_n, child_seed, dtype = args
+    return generate_matrix(distribution, theta, 1, max_n, np.random.default_rng(child_seed), dtype)[0]
+
+
+def generate_series_matrix(distribution, theta, num_series, max_n, seed=None, workers=None, dtype=None):
+    # у каждой серии свой дочерний поток SeedSequence: результат не зависит от числа процессов
+    child_seeds = np.random.SeedSequence(seed).spawn(num_series)
+    tasks = [(distribution, theta, max_n, child_seed, dtype) for child_seed in child_seeds]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, num_series)
+
+    if workers <= 1:
+        rows = [_generate_series(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(_generate_series, tasks, chunksize=max(1, num_series // (4 * workers))))
+    return np.stack(rows)
+
+
+def generate_discrete_uniform_sample(theta, sample_size, rng=None, dtype=None):
+    return generate_discrete_uniform_matrix(theta, 1, sample_size, rng, dtype)[0]
+
+
+def generate_pareto_sample(theta, sample_size, rng=None, dtype=None):
+    return generate_pareto_matrix(theta, 1, sample_size, rng, dtype)[0]
+
+
+def stream_sample(distribution, theta, sample_size, chunk_size=CHUNK_SIZE, rng=None, dtype=None):
+    rng = np.random.default_rng(rng)
+    for start in range(0, sample_size, chunk_size):
+        yield generate_matrix(distribution, theta, 1, min(chunk_size, sample_size - start), rng, dtype)[0]
+
+
+def stream_sample_to_npy(distribution, theta, sample_size, filename, chunk_size=CHUNK_SIZE, rng=None, dtype=None):
+    dtype = sample_dtype(distribution, theta, dtype)
+    with open(filename, 'wb') as f:
+        # заголовок .npy пишется заранее, дальше блоки дописываются в конец файла
+        np.lib.format.write_array_header_2_0(f, {
+            'descr': np.lib.format.dtype_to_descr(dtype),
+            'fortran_order': False,
+            'shape': (sample_size,)
+        })
+        for chunk in stream_sample(distribution, theta, sample_size, chunk_size, rng, dtype):
+            chunk.tofile(f)
+
+
+def sample_meta_to_json(distribution, theta, sample_size, sample_file, filename):
+    with open(filename, 'w') as f:
+        json.dump({
+            'distribution': distribution,
+            'parameter': theta,
+            'sample_size': sample_size,
+            'sample_file': sample_file
+        }, f, indent=2)
+
+
+def sample_to_json(sample, distribution, theta, filename):
+    with open(filename, 'w') as f:
+        json.dump({
+            'distribution': distribution,
+            'parameter': theta,
+            'sample_size': len(sample),
+            'sample': sample.tolist()
+        }, f, indent=2)
+
+
+def save_series(matrix, distribution, theta, sample_sizes, filename, seed=None, export_json=True):
+    series_set = SeriesSet(distribution, theta, sample_sizes, matrix[:, :max(sample_sizes)], seed)
+    if export_json:
+        save_series_json(series_set, filename)
+    # хранилище пишется после JSON, чтобы load_series считал его актуальным
+    save_series_store(series_set, store_path_for(filename))
@@ -0,0 +1,55 @@
+import numpy as np
+
+from generators import CHUNK_SIZE
+
+
+class HistogramAccumulator:
+    # гистограмма с заранее фиксированными границами: обновляется блоками и
+    # складывается с другими (по сериям, по процессам) без хранения самих наблюдений
+    def __init__(self, edges):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.total = 0
+        self.outside = 0
+
+    @classmethod
+    def log_spaced(cls, low, high, num_bins):
+        return cls(np.geomspace(low, high, num_bins + 1))
+
+    @classmethod
+    def from_quantiles(cls, dist, num_bins, tail=1e-4):
+        # равновероятные интервалы; последняя граница — квантиль 1 - tail, остальное в outside
+        return cls(dist.ppf(np.linspace(0, 1 - tail, num_bins + 1)))
+
+    def update(self, chunk):
+        chunk = np.asarray(chunk).ravel()
+        counts, _ = np.histogram(chunk, bins=self.edges)
+        self.counts += counts
+        self.total += len(chunk)
+        self.outside += len(chunk) - int(counts.sum())
+        return self
+
+    def update_chunked(self, sample, chunk_size=CHUNK_SIZE):
+        for start in range(0, len(sample), chunk_size):
+            self.update(sample[start:start + chunk_size])
+        return self
+
+    def merge(self, other):
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Нельзя объединить гистограммы с разными границами интервалов")
+        self.counts += other.counts
+        self.total += other.total
+        self.outside += other.outside
+        return self
+
+    @property
+    def widths(self):
+        return np.diff(self.edges)
+
+    @property
+    def midpoints(self):
+        return (self.edges[:-1] + self.edges[1:]) / 2
+
+    def density(self):
+        # нормировка на все наблюдения, включая попавшие за границы
+        return self.counts / (self.total * self.widths)
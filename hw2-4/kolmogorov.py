@@ -0,0 +1,86 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+import numpy as np
+
+from generators import CHUNK_SIZE
+
+# меньше этого суммарного объёма пар пул процессов не окупается
+PARALLEL_MIN_POINTS = 10 ** 6
+
+
+def sup_distance(ecdf_a, ecdf_b):
+    # sup_t |F_a(t) - F_b(t)| слиянием двух отсортированных выборок: устойчивая
+    # сортировка склеенных упорядоченных серий линейна, разность ФР — накопленная сумма скачков
+    merged = np.concatenate((ecdf_a.sorted_sample, ecdf_b.sorted_sample))
+    jumps = np.concatenate((ecdf_a.increments(), -ecdf_b.increments()))
+    order = np.argsort(merged, kind='stable')
+    merged = merged[order]
+    diff = np.cumsum(jumps[order])
+    # при совпадающих значениях разность смотрим только после последнего из них
+    group_ends = np.flatnonzero(np.append(merged[1:] != merged[:-1], True))
+    return float(np.max(np.abs(diff[group_ends])))
+
+
+def _sup_distance_pair(args):
+    ecdf_a, ecdf_b = args
+    return sup_distance(ecdf_a, ecdf_b)
+
+
+def sup_distance_matrix(ecdfs, workers=None):
+    pairs = list(combinations(range(len(ecdfs)), 2))
+    tasks = [(ecdfs[i], ecdfs[j]) for i, j in pairs]
+    total_points = sum(ecdfs[i].n + ecdfs[j].n for i, j in pairs)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if total_points >= PARALLEL_MIN_POINTS else 1
+
+    if workers <= 1:
+        values = [_sup_distance_pair(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            values = list(pool.map(_sup_distance_pair, tasks))
+
+    sup_matrix = np.zeros((len(ecdfs), len(ecdfs)))
+    for (i, j), value in zip(pairs, values):
+        sup_matrix[i, j] = sup_matrix[j, i] = value
+    return sup_matrix
+
+
+def grid_sup_distance_matrix(cdf_values):
+    # ФР, заданные на общей сетке (строка — одна ФР): для дискретных данных сетка 1..θ
+    cdf_values = np.asarray(cdf_values)
+    return np.max(np.abs(cdf_values[:, None, :] - cdf_values[None, :, :]), axis=-1)
+
+
+def two_sample_scale(sizes):
+    n = np.asarray(sizes, dtype=np.float64)
+    return np.sqrt(np.outer(n, n) / np.add.outer(n, n))
+
+
+def two_sample_matrix(ecdfs, sizes, workers=None):
+    return two_sample_scale(sizes) * sup_distance_matrix(ecdfs, workers)
+
+
+def corrected_statistic(d_n, n):
+    # статистика с поправкой Большева: S = (6 n D_n + 1) / (6 sqrt(n))
+    return (6 * n * d_n + 1) / (6 * np.sqrt(n))
+
+
+def one_sample_matrix(matrix, sizes, cdf, chunk_size=CHUNK_SIZE):
+    # одновыборочный критерий для каждой клетки (серия × объём): префикс каждой серии
+    # сортируется один раз, cdf векторизована; строки идут блоками не больше chunk_size элементов
+    matrix = np.asarray(matrix)
+    sizes = np.asarray(sizes)
+    num_series = matrix.shape[0]
+    d_plus = np.empty((num_series, len(sizes)))
+    d_minus = np.empty_like(d_plus)
+    for size_idx, n in enumerate(sizes):
+        i = np.arange(1, n + 1)
+        rows = max(1, chunk_size // n)
+        for start in range(0, num_series, rows):
+            values = cdf(np.sort(matrix[start:start + rows, :n], axis=-1))
+            d_plus[start:start + rows, size_idx] = np.max(i / n - values, axis=-1)
+            d_minus[start:start + rows, size_idx] = np.max(values - (i - 1) / n, axis=-1)
+    d_n = np.maximum(d_plus, d_minus)
+    return {'D_plus': d_plus, 'D_minus': d_minus, 'D_n': d_n, 'S': corrected_statistic(d_n, sizes)}
@@ -0,0 +1,131 @@
+import numpy as np
+
+from generators import CHUNK_SIZE
+
+
+class MomentAccumulator:
+    # число наблюдений, среднее и центральные суммы M2 (и при higher=True M3, M4) за один проход;
+    # блоки и частичные результаты объединяются точно по формулам Чана–Пебая.
+    # Для матрицы (серии × n) всё считается по последней оси, отдельно для каждой строки
+    def __init__(self, higher=False):
+        self.higher = higher
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+
+    def update(self, chunk):
+        chunk = np.asarray(chunk, dtype=np.float64)
+        count = chunk.shape[-1]
+        if count == 0:
+            return self
+        mean = chunk.mean(axis=-1)
+        deviations = chunk - mean[..., None]
+        squares = deviations * deviations
+        other = MomentAccumulator(self.higher)
+        other.count = count
+        other.mean = mean
+        other.m2 = squares.sum(axis=-1)
+        if self.higher:
+            other.m3 = (squares * deviations).sum(axis=-1)
+            other.m4 = (squares * squares).sum(axis=-1)
+        return self.merge(other)
+
+    def update_chunked(self, sample, chunk_size=CHUNK_SIZE):
+        for start in range(0, sample.shape[-1], chunk_size):
+            self.update(sample[..., start:start + chunk_size])
+        return self
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.m3, self.m4 = other.count, other.mean, other.m2, other.m3, other.m4
+            return self
+
+        n_a, n_b = self.count, other.count
+        n = n_a + n_b
+        delta = other.mean - self.mean
+        delta_n = delta / n
+        m2 = self.m2 + other.m2 + delta * delta_n * n_a * n_b
+        if self.higher:
+            delta_n2 = delta_n * delta_n
+            m3 = (self.m3 + other.m3 + delta * delta_n2 * n_a * n_b * (n_a - n_b)
+                  + 3 * delta_n * (n_a * other.m2 - n_b * self.m2))
+            m4 = (self.m4 + other.m4 + delta * delta_n2 * delta_n * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+                  + 6 * delta_n2 * (n_a * n_a * other.m2 + n_b * n_b * self.m2)
+                  + 4 * delta_n * (n_a * other.m3 - n_b * self.m3))
+            self.m3, self.m4 = m3, m4
+        self.mean = self.mean + delta_n * n_b
+        self.m2 = m2
+        self.count = n
+        return self
+
+    def variance(self, ddof=0):
+        # при ddof=0 это выборочная дисперсия S² из задания
+        return self.m2 / (self.count - ddof)
+
+    def skewness(self):
+        return np.sqrt(self.count) * self.m3 / self.m2 ** 1.5
+
+    def kurtosis(self):
+        # эксцесс
+        return self.count * self.m4 / (self.m2 * self.m2) - 3
+
+
+def _check_positions(positions, total):
+    # непокрытые клетки результата остались бы неинициализированными
+    if len(positions) and (positions.min() < 1 or positions.max() > total):
+        raise ValueError(f"Объёмы выборок должны быть от 1 до {total}, получено {positions.tolist()}")
+
+
+def prefix_moments(series, sizes=None, chunk_size=CHUNK_SIZE):
+    # X̄ и S² для каждого префикса серии (или каждой строки матрицы) по накопленным суммам
+    # за один проход; суммы берутся от x - x_1, чтобы E[x²] - X̄² не терял точность
+    series = np.asarray(series)
+    total = series.shape[-1]
+    positions = np.arange(1, total + 1) if sizes is None else np.asarray(sizes)
+    _check_positions(positions, total)
+    shift = series[..., :1].astype(np.float64)
+
+    sum1 = np.empty(series.shape[:-1] + (len(positions),))
+    sum2 = np.empty_like(sum1)
+    carry1 = np.zeros(series.shape[:-1])
+    carry2 = np.zeros(series.shape[:-1])
+    for start in range(0, total, chunk_size):
+        block = series[..., start:start + chunk_size] - shift
+        cum1 = np.cumsum(block, axis=-1) + carry1[..., None]
+        cum2 = np.cumsum(block * block, axis=-1) + carry2[..., None]
+        # какие из запрошенных префиксов заканчиваются в этом блоке
+        wanted = (positions > start) & (positions <= start + block.shape[-1])
+        sum1[..., wanted] = cum1[..., positions[wanted] - start - 1]
+        sum2[..., wanted] = cum2[..., positions[wanted] - start - 1]
+        carry1, carry2 = cum1[..., -1], cum2[..., -1]
+
+    shifted_mean = sum1 / positions
+    variance = np.maximum(sum2 / positions - shifted_mean * shifted_mean, 0.0)
+    return shifted_mean + shift, variance
+
+
+def prefix_accumulate(series, sizes, ufunc=np.add, transform=None, chunk_size=CHUNK_SIZE):
+    # накопленная свёртка ufunc (сумма, максимум, ...) по последней оси в точках sizes,
+    # блоками: в памяти одновременно только блок и ответы
+    series = np.asarray(series)
+    positions = np.asarray(sizes)
+    _check_positions(positions, series.shape[-1])
+    result = None
+    carry = None
+    for start in range(0, series.shape[-1], chunk_size):
+        block = series[..., start:start + chunk_size]
+        if transform is not None:
+            block = transform(block)
+        cumulative = ufunc.accumulate(block, axis=-1)
+        if carry is not None:
+            cumulative = ufunc(cumulative, carry[..., None])
+        if result is None:
+            result = np.empty(series.shape[:-1] + (len(positions),), dtype=cumulative.dtype)
+        wanted = (positions > start) & (positions <= start + block.shape[-1])
+        result[..., wanted] = cumulative[..., positions[wanted] - start - 1]
+        carry = cumulative[..., -1]
+    return result
@@ -0,0 +1,102 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from estimators import ESTIMATORS, estimate_matrix
+from generators import generate_matrix
+from moments import MomentAccumulator
+
+# наблюдений в одном блоке репликаций: память ~ BLOCK_ELEMENTS * 8 байт на процесс
+BLOCK_ELEMENTS = 2 ** 22
+
+
+def simulate_block(args):
+    distribution, theta, n, block_size, seed = args
+    matrix = generate_matrix(distribution, theta, block_size, n, np.random.default_rng(seed))
+    estimates = estimate_matrix(distribution, matrix, [n])
+    stats = {}
+    for name in ESTIMATORS:
+        values = estimates[name][:, 0]
+        finite = values[np.isfinite(values)]
+        errors = finite - theta
+        # моменты самих оценок (для смещения и дисперсии) и квадратов ошибок (для СКО)
+        stats[name] = (MomentAccumulator(higher=True).update(finite),
+                       MomentAccumulator().update(errors * errors),
+                       len(values) - len(finite))
+    return stats
+
+
+def run_monte_carlo(distribution, theta, n, replications, seed=None, workers=None, block_size=None):
+    if block_size is None:
+        block_size = max(1, BLOCK_ELEMENTS // n)
+    block_sizes = [min(block_size, replications - start) for start in range(0, replications, block_size)]
+    # свой дочерний seed у каждого блока: результат не зависит от числа процессов
+    seeds = np.random.SeedSequence(seed).spawn(len(block_sizes))
+    tasks = [(distribution, theta, n, size, block_seed) for size, block_seed in zip(block_sizes, seeds)]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(tasks))
+    if workers <= 1:
+        blocks = [simulate_block(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            blocks = list(pool.map(simulate_block, tasks))
+
+    totals = {name: [MomentAccumulator(higher=True), MomentAccumulator(), 0] for name in ESTIMATORS}
+    for block in blocks:
+        for name, (estimate_moments, squared_error_moments, undefined) in block.items():
+            totals[name][0].merge(estimate_moments)
+            totals[name][1].merge(squared_error_moments)
+            totals[name][2] += undefined
+
+    return {name: summarize(theta, *total) for name, total in totals.items()}
+
+
+def summarize(theta, estimate_moments, squared_error_moments, undefined):
+    count = estimate_moments.count
+    if count < 2:
+        return {'bias': np.nan, 'bias_se': np.nan, 'variance': np.nan, 'variance_se': np.nan,
+                'mse': np.nan, 'mse_se': np.nan, 'undefined': undefined}
+    variance = estimate_moments.variance()
+    fourth = estimate_moments.m4 / count
+    return {
+        'bias': estimate_moments.mean - theta,
+        'bias_se': np.sqrt(estimate_moments.variance(ddof=1) / count),
+        'variance': variance,
+        # асимптотическая ошибка выборочной дисперсии: sqrt((μ4 - σ⁴) / R)
+        'variance_se': np.sqrt(max(fourth - variance * variance, 0.0) / count),
+        'mse': squared_error_moments.mean,
+        'mse_se': np.sqrt(squared_error_moments.variance(ddof=1) / count),
+        'undefined': undefined,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Смещение, дисперсия и СКО оценок θ методом Монте-Карло")
+    parser.add_argument('--replications', type=int, default=10 ** 4)
+    parser.add_argument('--sizes', nargs='+', type=int, default=[5, 10, 100, 200, 400, 600, 800, 1000])
+    parser.add_argument('--discrete-theta', type=int, default=121)
+    parser.add_argument('--pareto-theta', type=float, default=12)
+    parser.add_argument('--seed', type=int, default=2024)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    for distribution, theta in (('discrete_uniform', args.discrete_theta), ('pareto', args.pareto_theta)):
+        print(f"\n{distribution}: θ = {theta}, R = {args.replications}")
+        print(f"{'n':>6} {'оценка':>7} {'смещение':>23}{'дисперсия':>25}{'MSE':>25}")
+        print("-" * 88)
+        for n in args.sizes:
+            results = run_monte_carlo(distribution, theta, n, args.replications, args.seed, args.workers)
+            for name in ESTIMATORS:
+                r = results[name]
+                print(f"{n:>6} {name:>7} {r['bias']:>12.6f} ± {r['bias_se']:<8.6f}"
+                      f"{r['variance']:>14.6f} ± {r['variance_se']:<8.4f}"
+                      f"{r['mse']:>14.6f} ± {r['mse_se']:<8.4f}"
+                      + (f"  (не определена в {r['undefined']} репликациях)" if r['undefined'] else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+from decimation import decimate_indices, pixel_grid
+from distributions import distribution_of
+from ecdf import pooled_ecdf
+from frequencies import DiscreteFrequencies
+from histogram import HistogramAccumulator
+
+
+def _finish(fig, ax, title, xlabel, ylabel):
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    return fig
+
+
+def plot_discrete_ecdf(data, size):
+    t_values = np.arange(1, data.theta + 1)
+    empirical_values = DiscreteFrequencies(data.prefix(size), data.theta).ecdf().mean(axis=0)
+    theoretical_values = distribution_of(data).cdf(t_values)
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.plot(t_values, empirical_values, 'b-', linewidth=2, label='Эмпирическая F(t)')
+    ax.plot(t_values, theoretical_values, 'r--', linewidth=2, label='Теоретическая F(t)')
+    return _finish(fig, ax, f'Сравнение эмпирической и теоретической функций распределения (n={size}, θ={data.theta})',
+                   't', 'F(t)')
+
+
+def plot_pareto_ecdf(data, size):
+    dist = distribution_of(data)
+    pooled = pooled_ecdf(data.prefix(size))
+    t_values, right_values = pooled.steps()
+    empirical_values = pooled(t_values)
+    theoretical_values = dist.cdf(t_values)
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    # до разрешения в пикселях, сохраняя точки наибольшего отклонения до и после скачка
+    num_pixels = int(fig.get_figwidth() * fig.dpi)
+    keep = decimate_indices(t_values, (empirical_values - theoretical_values,
+                                       right_values - theoretical_values), num_pixels)
+    theory_t = np.union1d(t_values[keep], pixel_grid(t_values, num_pixels))
+
+    # Ступенчатая функция для эмпирической ФР
+    ax.step(t_values[keep], empirical_values[keep], where='post', linewidth=2, label='Эмпирическая F(t)')
+    # Теоретическая ФР в тех же точках и на сетке пикселей
+    ax.plot(theory_t, dist.cdf(theory_t), 'r-', linewidth=2, label='Теоретическая F(t)', markersize=4)
+    return _finish(fig, ax, f'Сравнение эмпирической и теоретической функций распределения Парето (n={size}, θ={data.theta})',
+                   't', 'F(t)')
+
+
+def plot_discrete_polygon(data, size):
+    t_values = np.arange(1, data.theta + 1)
+    # относительные частоты всех серий одним bincount, затем среднее по сериям
+    empirical_freq_values = DiscreteFrequencies(data.prefix(size), data.theta).relative().mean(axis=0)
+    theoretical_density_values = distribution_of(data).pmf(t_values)
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.plot(t_values, empirical_freq_values, 'bo-', linewidth=2, markersize=3, label='Усредненный полигон частот')
+    ax.stem(t_values, theoretical_density_values, linefmt='r-', markerfmt='ro', basefmt=' ', label='Теоретическая плотность')
+    ax.get_lines()[1].set_markersize(2)
+    return _finish(fig, ax, f'Сравнение усредненного полигона частот и теоретической плотности (n={size}, θ={data.theta})',
+                   'Значение t', 'Вероятность/Частота')
+
+
+def combined_histogram(data, size, num_bins=15):
+    # логарифмические интервалы до квантиля 1 - 1e-4: у Парето почти вся масса у единицы,
+    # при равных интервалах она попадала бы в первый столбец
+    histogram = HistogramAccumulator.log_spaced(1.0, float(distribution_of(data).ppf(1 - 1e-4)), num_bins)
+    for series_idx in range(data.num_series):
+        histogram.update_chunked(data.sample(series_idx, size))
+    return histogram
+
+
+def plot_pareto_histogram(data, size):
+    histogram = combined_histogram(data, size)
+    bin_midpoints = histogram.midpoints
+    empirical_density = histogram.density()
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.bar(bin_midpoints, empirical_density, width=histogram.widths,
+           alpha=0.5, color='lightblue', edgecolor='blue', linewidth=1,
+           label=f'Гистограмма (по {histogram.total} наблюдениям)')
+    ax.plot(bin_midpoints, empirical_density, 'bo-', linewidth=2, markersize=6,
+            label='Полигон частот')
+    x_smooth = np.geomspace(min(bin_midpoints), max(bin_midpoints), 1000)
+    ax.plot(x_smooth, distribution_of(data).pdf(x_smooth), 'r-', linewidth=2, label='Теоретическая плотность')
+    return _finish(fig, ax, 'Сравнение гистограммы и полигона частот по всем выборкам с плотностью '
+                   f'для распределения Парето (n={size}, θ={data.theta})',
+                   'Значение x', 'Плотность вероятности')
+
+
+def plot_estimator_trajectories(sizes, trajectories, theta, title):
+    # траектории оценок одной серии; длинные ряды прореживаются до разрешения в пикселях
+    fig, ax = plt.subplots(figsize=(12, 6))
+    num_pixels = int(fig.get_figwidth() * fig.dpi)
+    log_sizes = np.log(sizes)
+    for name, style in (('MM', 'b-'), ('MLE', 'g-'), ('UMVU', 'm-')):
+        values = trajectories[name]
+        finite = np.isfinite(values)
+        keep = decimate_indices(log_sizes[finite], (values[finite] - theta,), num_pixels)
+        ax.plot(sizes[finite][keep], values[finite][keep], style, linewidth=1, label=f'θ_{name}')
+    ax.axhline(theta, color='r', linestyle='--', linewidth=2, label=f'θ = {theta}')
+    ax.set_xscale('log')
+    return _finish(fig, ax, title, 'n', 'Оценка θ')
+
+
+# тип рисунка -> (набор данных, функция построения)
+FIGURES = {
+    'ecdf_discrete_uniform': ('discrete_uniform', plot_discrete_ecdf),
+    'ecdf_pareto': ('pareto', plot_pareto_ecdf),
+    'polygon_discrete_uniform': ('discrete_uniform', plot_discrete_polygon),
+    'histogram_pareto': ('pareto', plot_pareto_histogram),
+}
@@ -0,0 +1,52 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+# без окон и без input(): рисунки только сохраняются в файлы
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+
+from datasets import load_dataset
+from plotting import FIGURES
+
+
+def render_figure(args):
+    kind, size, out_dir, formats = args
+    dataset, plot = FIGURES[kind]
+    fig = plot(load_dataset(dataset), size)
+    paths = []
+    for fmt in formats:
+        path = os.path.join(out_dir, f"{kind}_n{size}.{fmt}")
+        fig.savefig(path)
+        paths.append(path)
+    plt.close(fig)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пакетная отрисовка всех рисунков заданий 2.2-2.3")
+    parser.add_argument('--out', default='figures', help="каталог для рисунков")
+    parser.add_argument('--formats', nargs='+', default=['png', 'svg'], choices=['png', 'svg', 'pdf'])
+    parser.add_argument('--kinds', nargs='+', default=list(FIGURES), choices=list(FIGURES))
+    parser.add_argument('--sizes', nargs='+', type=int, help="объёмы выборок (по умолчанию все)")
+    parser.add_argument('--workers', type=int, default=None, help="число процессов")
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    tasks = []
+    for kind in args.kinds:
+        sizes = args.sizes or load_dataset(FIGURES[kind][0]).sample_sizes
+        tasks.extend((kind, size, args.out, args.formats) for size in sizes)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for paths in pool.map(render_figure, tasks):
+            print("  ".join(paths))
+
+    print(f"\nСохранено рисунков: {len(tasks) * len(args.formats)} в каталог '{args.out}'")
+
+
+if __name__ == "__main__":
+    main()
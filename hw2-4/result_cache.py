@@ -0,0 +1,122 @@
+import functools
+import hashlib
+import json
+import os
+import pickle
+import sys
+import types
+
+import numpy as np
+
+from datasets import CACHE_DIR, dataset_hash, file_hash
+
+RESULTS_DIR = os.path.join(CACHE_DIR, 'results')
+
+# при превышении удаляются результаты, к которым дольше всего не обращались
+MAX_CACHE_BYTES = 512 * 2 ** 20
+
+_LOCAL_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _local_file(module):
+    path = getattr(module, '__file__', None)
+    # у интерактивного __main__ файла нет
+    if path is None or not os.path.isfile(path) or os.path.dirname(os.path.abspath(path)) != _LOCAL_DIR:
+        return None
+    return os.path.abspath(path)
+
+
+def code_hash(fn):
+    # хэш исходников модуля функции и всех модулей этого каталога, которые он
+    # (транзитивно) использует: правка любого из них делает старые результаты недействительными
+    digest = hashlib.sha256()
+    pending = [sys.modules[fn.__module__]]
+    seen = set()
+    while pending:
+        module = pending.pop()
+        path = _local_file(module)
+        if path is None or path in seen:
+            continue
+        seen.add(path)
+        for value in vars(module).values():
+            if isinstance(value, types.ModuleType):
+                pending.append(value)
+            elif getattr(value, '__module__', None) in sys.modules:
+                pending.append(sys.modules[value.__module__])
+    for path in sorted(seen):
+        digest.update(file_hash(path).encode())
+    return digest.hexdigest()
+
+
+def _key_value(value):
+    # массивы — по содержимому (repr длинного массива пропускает середину), скаляры numpy —
+    # как числа Python; всё остальное, что не сериализуется в JSON, не может быть частью ключа
+    if isinstance(value, np.ndarray):
+        return {'sha256': hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest(),
+                'dtype': value.dtype.str, 'shape': list(value.shape)}
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Аргумент типа {type(value).__name__} нельзя использовать в ключе кэша")
+
+
+def result_key(fn, dataset, args, kwargs):
+    key = {
+        'function': f"{fn.__module__}.{fn.__qualname__}",
+        'code': code_hash(fn),
+        'dataset': dataset_hash(dataset),
+        'args': args,
+        'kwargs': kwargs,
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True, default=_key_value).encode()).hexdigest()
+
+
+def _evict(max_bytes):
+    # временные файлы других процессов пропускаем; файлы могут исчезнуть по ходу —
+    # их переименовал или удалил параллельный запуск
+    entries = []
+    for name in os.listdir(RESULTS_DIR):
+        if name.endswith('.tmp'):
+            continue
+        path = os.path.join(RESULTS_DIR, name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime_ns, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def cached_result(fn):
+    # первый аргумент функции — имя набора данных (или путь к нему); результат хранится
+    # на диске под ключом (хэш данных, функция с её кодом, параметры)
+    @functools.wraps(fn)
+    def wrapper(dataset, *args, **kwargs):
+        path = os.path.join(RESULTS_DIR, result_key(fn, dataset, args, kwargs) + '.pkl')
+        try:
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+            # время изменения служит временем последнего обращения для LRU
+            os.utime(path)
+            return result
+        except FileNotFoundError:
+            # нет в кэше или только что вытеснен параллельным запуском
+            pass
+
+        result = fn(dataset, *args, **kwargs)
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+        _evict(MAX_CACHE_BYTES)
+        return result
+
+    return wrapper
@@ -0,0 +1,157 @@
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+
+# бинарное хранилище: каталог <имя>.store с meta.json и матрицей серий series.npy
+STORE_SUFFIX = '.store'
+
+FLOAT_DTYPES = (np.float32, np.float64)
+
+
+def sample_dtype(distribution, theta, dtype=None):
+    if distribution == 'discrete_uniform':
+        # значения 1..θ: по умолчанию самый узкий беззнаковый тип, при θ = 121 это uint8
+        if dtype is None:
+            return np.min_scalar_type(int(theta))
+        dtype = np.dtype(dtype)
+        if dtype.kind not in 'ui' or np.iinfo(dtype).max < theta:
+            raise ValueError(f"Для распределения {distribution} допустимы только целые типы, вмещающие θ = {theta}, "
+                             f"получено {dtype}")
+        return dtype
+    dtype = np.dtype(np.float64 if dtype is None else dtype)
+    if dtype not in FLOAT_DTYPES:
+        raise ValueError(f"Для распределения {distribution} допустимы только float32 и float64, получено {dtype}")
+    return dtype
+
+
+class SeriesSet:
+    # каждая серия хранится один раз целиком; выборка объёма n — её префикс длины n
+    def __init__(self, distribution, theta, sample_sizes, matrix, seed=None):
+        self.distribution = distribution
+        self.theta = theta
+        self.sample_sizes = list(sample_sizes)
+        self.matrix = matrix
+        self.seed = seed
+
+    @property
+    def num_series(self):
+        return self.matrix.shape[0]
+
+    def sample(self, series_idx, size):
+        return self.matrix[series_idx, :size]
+
+    def samples(self, series_idx):
+        return {size: self.matrix[series_idx, :size] for size in self.sample_sizes}
+
+    def prefix(self, size):
+        return self.matrix[:, :size]
+
+
+def series_from_json(data, dtype=None):
+    max_n = max(data['sample_sizes'])
+    rows = []
+    for series_data in data['series']:
+        if 'sample' in series_data:
+            rows.append(series_data['sample'])
+        else:
+            # старый формат: копия префикса для каждого объёма, берём самый длинный
+            rows.append(series_data['samples'][str(max_n)])
+    dtype = sample_dtype(data['distribution'], data['parameter'], dtype)
+    return SeriesSet(data['distribution'], data['parameter'], data['sample_sizes'],
+                     np.array(rows, dtype=dtype), data.get('seed'))
+
+
+def store_path_for(json_path):
+    return os.path.splitext(json_path)[0] + STORE_SUFFIX
+
+
+def save_series_store(series_set, path, overwrite=True):
+    # хранилище собирается во временном каталоге рядом и переименовывается, когда meta.json
+    # уже записан: параллельный читатель видит либо готовое хранилище, либо никакого
+    path = os.path.abspath(path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    shutil.rmtree(temp_path, ignore_errors=True)
+    os.makedirs(temp_path)
+    np.save(os.path.join(temp_path, 'series.npy'), series_set.matrix)
+    with open(os.path.join(temp_path, 'meta.json'), 'w') as f:
+        json.dump({
+            'distribution': series_set.distribution,
+            'parameter': series_set.theta,
+            'sample_sizes': series_set.sample_sizes,
+            'num_series': series_set.num_series,
+            'seed': series_set.seed
+        }, f, indent=2)
+
+    if overwrite and os.path.isdir(path):
+        shutil.rmtree(path)
+    try:
+        os.rename(temp_path, path)
+    except OSError:
+        # то же хранилище уже успел записать другой процесс
+        shutil.rmtree(temp_path, ignore_errors=True)
+        if overwrite or not os.path.exists(os.path.join(path, 'meta.json')):
+            raise
+
+
+def open_series_store(path, mmap_mode='r'):
+    with open(os.path.join(path, 'meta.json'), 'r') as f:
+        meta = json.load(f)
+    # с mmap_mode читаются только страницы, к которым обращаются срезы
+    matrix = np.load(os.path.join(path, 'series.npy'), mmap_mode=mmap_mode)
+    return SeriesSet(meta['distribution'], meta['parameter'], meta['sample_sizes'], matrix, meta['seed'])
+
+
+def convert_json_to_store(json_path, store_path=None, dtype=None):
+    if store_path is None:
+        store_path = store_path_for(json_path)
+    with open(json_path, 'r') as f:
+        data = json.load(f)
+    save_series_store(series_from_json(data, dtype), store_path)
+    return store_path
+
+
+def fresh_store_for(json_path):
+    store_path = store_path_for(json_path)
+    meta_path = os.path.join(store_path, 'meta.json')
+    if os.path.exists(meta_path) and os.path.getmtime(meta_path) >= os.path.getmtime(json_path):
+        return store_path
+    return None
+
+
+def load_series(filename):
+    if os.path.isdir(filename):
+        return open_series_store(filename)
+
+    store_path = fresh_store_for(filename)
+    if store_path is not None:
+        return open_series_store(store_path)
+
+    with open(filename, 'r') as f:
+        data = json.load(f)
+    return series_from_json(data)
+
+
+def save_series_json(series_set, filename):
+    data = {
+        'distribution': series_set.distribution,
+        'parameter': series_set.theta,
+        'sample_sizes': series_set.sample_sizes,
+        'num_series': series_set.num_series,
+        'series': [
+            {'series_number': series_idx + 1, 'sample': row.tolist()}
+            for series_idx, row in enumerate(series_set.matrix)
+        ]
+    }
+    if series_set.seed is not None:
+        data['seed'] = series_set.seed
+
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+if __name__ == "__main__":
+    for json_path in sys.argv[1:] or ['discrete_uniform_series.json', 'pareto_series.json']:
+        print(f"{json_path} -> {convert_json_to_store(json_path)}")
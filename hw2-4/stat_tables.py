@@ -0,0 +1,187 @@
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+from kolmogorov import corrected_statistic
+
+# уровни значимости, для которых хранятся квантили
+ALPHAS = (0.1, 0.05, 0.025, 0.01, 0.005, 0.001)
+
+# χ²-квантили порядка 1 - α: число степеней свободы -> значения для ALPHAS
+CHI2_QUANTILES = {
+    1: (2.7055, 3.8415, 5.0239, 6.6349, 7.8794, 10.8276),
+    2: (4.6052, 5.9915, 7.3778, 9.2103, 10.5966, 13.8155),
+    3: (6.2514, 7.8147, 9.3484, 11.3449, 12.8382, 16.2662),
+    4: (7.7794, 9.4877, 11.1433, 13.2767, 14.8603, 18.4668),
+    5: (9.2364, 11.0705, 12.8325, 15.0863, 16.7496, 20.5150),
+    6: (10.6446, 12.5916, 14.4494, 16.8119, 18.5476, 22.4577),
+    7: (12.0170, 14.0671, 16.0128, 18.4753, 20.2777, 24.3219),
+    8: (13.3616, 15.5073, 17.5345, 20.0902, 21.9550, 26.1245),
+    9: (14.6837, 16.9190, 19.0228, 21.6660, 23.5894, 27.8772),
+    10: (15.9872, 18.3070, 20.4832, 23.2093, 25.1882, 29.5883),
+    11: (17.2750, 19.6751, 21.9200, 24.7250, 26.7568, 31.2641),
+    12: (18.5493, 21.0261, 23.3367, 26.2170, 28.2995, 32.9095),
+    13: (19.8119, 22.3620, 24.7356, 27.6882, 29.8195, 34.5282),
+    14: (21.0641, 23.6848, 26.1189, 29.1412, 31.3193, 36.1233),
+    15: (22.3071, 24.9958, 27.4884, 30.5779, 32.8013, 37.6973),
+    16: (23.5418, 26.2962, 28.8454, 31.9999, 34.2672, 39.2524),
+    17: (24.7690, 27.5871, 30.1910, 33.4087, 35.7185, 40.7902),
+    18: (25.9894, 28.8693, 31.5264, 34.8053, 37.1565, 42.3124),
+    19: (27.2036, 30.1435, 32.8523, 36.1909, 38.5823, 43.8202),
+    20: (28.4120, 31.4104, 34.1696, 37.5662, 39.9968, 45.3147),
+    21: (29.6151, 32.6706, 35.4789, 38.9322, 41.4011, 46.7970),
+    22: (30.8133, 33.9244, 36.7807, 40.2894, 42.7957, 48.2679),
+    23: (32.0069, 35.1725, 38.0756, 41.6384, 44.1813, 49.7282),
+    24: (33.1962, 36.4150, 39.3641, 42.9798, 45.5585, 51.1786),
+    25: (34.3816, 37.6525, 40.6465, 44.3141, 46.9279, 52.6197),
+    26: (35.5632, 38.8851, 41.9232, 45.6417, 48.2899, 54.0520),
+    27: (36.7412, 40.1133, 43.1945, 46.9629, 49.6449, 55.4760),
+    28: (37.9159, 41.3371, 44.4608, 48.2782, 50.9934, 56.8923),
+    29: (39.0875, 42.5570, 45.7223, 49.5879, 52.3356, 58.3012),
+    30: (40.2560, 43.7730, 46.9792, 50.8922, 53.6720, 59.7031),
+    40: (51.8051, 55.7585, 59.3417, 63.6907, 66.7660, 73.4020),
+    50: (63.1671, 67.5048, 71.4202, 76.1539, 79.4900, 86.6608),
+    60: (74.3970, 79.0819, 83.2977, 88.3794, 91.9517, 99.6072),
+    70: (85.5270, 90.5312, 95.0232, 100.4252, 104.2149, 112.3169),
+    80: (96.5782, 101.8795, 106.6286, 112.3288, 116.3211, 124.8392),
+    90: (107.5650, 113.1453, 118.1359, 124.1163, 128.2989, 137.2084),
+    100: (118.4980, 124.3421, 129.5612, 135.8067, 140.1695, 149.4493),
+}
+
+# квантили предельного распределения Колмогорова K(λ) порядка 1 - α
+KOLMOGOROV_QUANTILES = (1.2238, 1.3581, 1.4802, 1.6276, 1.7308, 1.9495)
+
+# до этого объёма p-значения и критические значения D_n точные, дальше — по K(λ) для S
+KOLMOGOROV_EXACT_MAX_N = 20
+
+# точные квантили D_n порядка 1 - α
+KOLMOGOROV_EXACT_QUANTILES = {
+    1: (0.9500, 0.9750, 0.9875, 0.9950, 0.9975, 0.9995),
+    2: (0.7764, 0.8419, 0.8882, 0.9293, 0.9500, 0.9776),
+    3: (0.6360, 0.7076, 0.7679, 0.8290, 0.8643, 0.9206),
+    4: (0.5652, 0.6239, 0.6739, 0.7342, 0.7764, 0.8505),
+    5: (0.5094, 0.5633, 0.6126, 0.6685, 0.7054, 0.7814),
+    6: (0.4680, 0.5193, 0.5640, 0.6166, 0.6529, 0.7248),
+    7: (0.4361, 0.4834, 0.5256, 0.5758, 0.6098, 0.6793),
+    8: (0.4096, 0.4543, 0.4945, 0.5418, 0.5743, 0.6410),
+    9: (0.3875, 0.4300, 0.4681, 0.5133, 0.5444, 0.6085),
+    10: (0.3687, 0.4092, 0.4456, 0.4889, 0.5187, 0.5804),
+    11: (0.3524, 0.3912, 0.4261, 0.4677, 0.4964, 0.5559),
+    12: (0.3381, 0.3754, 0.4090, 0.4490, 0.4767, 0.5342),
+    13: (0.3255, 0.3614, 0.3938, 0.4325, 0.4592, 0.5149),
+    14: (0.3142, 0.3489, 0.3802, 0.4176, 0.4435, 0.4975),
+    15: (0.3040, 0.3376, 0.3679, 0.4042, 0.4293, 0.4818),
+    16: (0.2947, 0.3273, 0.3568, 0.3920, 0.4164, 0.4675),
+    17: (0.2863, 0.3180, 0.3466, 0.3809, 0.4046, 0.4544),
+    18: (0.2785, 0.3094, 0.3372, 0.3706, 0.3938, 0.4423),
+    19: (0.2714, 0.3014, 0.3286, 0.3612, 0.3838, 0.4312),
+    20: (0.2647, 0.2941, 0.3206, 0.3524, 0.3745, 0.4209),
+}
+
+# сетка для интерполяции K(λ): вне [0, 3.5] K равна 0 и 1 с точностью лучше 1e-10
+_LAMBDA_GRID = np.linspace(0.0, 3.5, 3501)
+
+
+def _kolmogorov_cdf(lam):
+    # K(λ) = 1 - 2 Σ (-1)^(k-1) exp(-2 k² λ²) быстро сходится при λ >= 1, при меньших λ —
+    # эквивалентный ряд sqrt(2π) / λ Σ exp(-(2k - 1)² π² / (8 λ²))
+    k = np.arange(1, 21)[:, None]
+    lam = lam[None, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        large = 1 - 2 * np.sum((-1.0) ** (k - 1) * np.exp(-2 * k * k * lam * lam), axis=0)
+        small = np.sqrt(2 * np.pi) / lam[0] * np.sum(np.exp(-(2 * k - 1) ** 2 * np.pi ** 2 / (8 * lam * lam)), axis=0)
+    return np.clip(np.where(lam[0] >= 1, large, np.nan_to_num(small)), 0.0, 1.0)
+
+
+_KOLMOGOROV_CDF = _kolmogorov_cdf(_LAMBDA_GRID)
+
+
+def _alpha_index(alpha):
+    for idx, value in enumerate(ALPHAS):
+        if math.isclose(alpha, value):
+            return idx
+    raise ValueError(f"Нет табличных значений для α = {alpha}, доступны {ALPHAS}")
+
+
+def chi2_critical(df, alpha=0.05):
+    if df < 1:
+        raise ValueError(f"Число степеней свободы должно быть положительным, получено {df}")
+    if df in CHI2_QUANTILES:
+        return CHI2_QUANTILES[df][_alpha_index(alpha)]
+    # вне таблицы — приближение Уилсона–Хилферти, при df > 30 ошибка меньше 0.2%
+    z = NormalDist().inv_cdf(1 - alpha)
+    scale = 2 / (9 * df)
+    return df * (1 - scale + z * math.sqrt(scale)) ** 3
+
+
+def chi2_pvalue(x, df):
+    # P(χ²_df >= x) для целого df в замкнутой форме
+    if x <= 0:
+        return 1.0
+    half = x / 2
+    if df % 2 == 0:
+        term, total = 1.0, 1.0
+        for j in range(1, df // 2):
+            term *= half / j
+            total += term
+        return min(1.0, math.exp(-half) * total)
+    root = math.sqrt(x)
+    term, total = 0.0, 0.0
+    if df > 1:
+        term = math.sqrt(2 / math.pi) * root * math.exp(-half)
+        total = term
+        for j in range(3, df, 2):
+            term *= x / j
+            total += term
+    return min(1.0, math.erfc(root / math.sqrt(2)) + total)
+
+
+def kolmogorov_critical(alpha=0.05, n=None):
+    # при n <= KOLMOGOROV_EXACT_MAX_N — точный квантиль D_n, иначе квантиль K(λ) для S
+    if n is not None and n <= KOLMOGOROV_EXACT_MAX_N:
+        return KOLMOGOROV_EXACT_QUANTILES[n][_alpha_index(alpha)]
+    return KOLMOGOROV_QUANTILES[_alpha_index(alpha)]
+
+
+def kolmogorov_criterion(alpha=0.05, n=None):
+    # какая статистика сравнивается с критическим значением и само значение
+    statistic = 'D_n' if n is not None and n <= KOLMOGOROV_EXACT_MAX_N else 'S'
+    return statistic, kolmogorov_critical(alpha, n)
+
+
+def kolmogorov_limit_pvalue(s):
+    # 1 - K(s) линейной интерполяцией по таблице, векторно
+    return 1 - np.interp(s, _LAMBDA_GRID, _KOLMOGOROV_CDF)
+
+
+def kolmogorov_exact_cdf(d, n):
+    # P(D_n < d) алгоритмом Марсальи–Цанга–Ванга (матрица H в степени n)
+    if d <= 0.5 / n:
+        return 0.0
+    if d >= 1:
+        return 1.0
+    k = int(n * d) + 1
+    m = 2 * k - 1
+    h = k - n * d
+    i, j = np.indices((m, m))
+    lower = i - j + 1
+    H = (lower >= 0).astype(np.float64)
+    powers = h ** np.arange(1, m + 1)
+    H[:, 0] -= powers
+    H[-1, :] -= powers[::-1]
+    if 2 * h - 1 > 0:
+        H[-1, 0] += (2 * h - 1) ** m
+    factorials = np.array([math.factorial(v) for v in range(m + 1)], dtype=np.float64)
+    H /= np.where(lower > 0, factorials[np.clip(lower, 0, m)], 1.0)
+    Q = np.linalg.matrix_power(H, n)
+    return float(Q[k - 1, k - 1] * math.factorial(n) / n ** n)
+
+
+def kolmogorov_pvalue(d_n, n):
+    # P(D_n >= d_n) для каждой клетки: точно при малых n, по K(λ) от S — при больших
+    d_n, n = np.broadcast_arrays(np.asarray(d_n, dtype=np.float64), np.asarray(n))
+    p_values = np.array(kolmogorov_limit_pvalue(corrected_statistic(d_n, n)), dtype=np.float64)
+    small = n <= KOLMOGOROV_EXACT_MAX_N
+    p_values[small] = [1 - kolmogorov_exact_cdf(d, int(size)) for d, size in zip(d_n[small], n[small])]
+    return p_values[()]
@@ -1,58 +1,30 @@
-import json
 import numpy as np
 
-with open('pareto_series.json', 'r') as f:
-    data = json.load(f)
+from datasets import load_dataset
+from ecdf import pooled_ecdf
+from kolmogorov import sup_distance_matrix, two_sample_scale
 
-theta = data['parameter']
-sample_sizes = data['sample_sizes']
-num_series = data['num_series']
-series = data['series']
+data = load_dataset('pareto')
 
-def empirical_cdf(sample, t):
-    count = sum(1 for x in sample if x < t)
-    return count / len(sample)
+theta = data.theta
+sample_sizes = data.sample_sizes
+num_series = data.num_series
 
-all_points = set()
-for size in sample_sizes:
-    for series_data in series:
-        sample = series_data['samples'][str(size)]
-        all_points.update(sample)
-all_points = sorted(all_points)
+# выборки вложены, поэтому все точки — это значения самых длинных префиксов
+all_points = np.unique(data.prefix(max(sample_sizes)))
 
 print(f"Всего уникальных точек: {len(all_points)}")
 print(f"Диапазон точек: от {min(all_points):.4f} до {max(all_points):.4f}")
 
-averaged_empirical = {}
-
-for size in sample_sizes:
-    averaged_empirical[size] = {}
-    for t in all_points:
-        f_values = []
-        for series_data in series:
-            sample = series_data['samples'][str(size)]
-            f_t = empirical_cdf(sample, t)
-            f_values.append(f_t)
-        avg_f_t = sum(f_values) / len(f_values)
-        averaged_empirical[size][t] = avg_f_t
+averaged_empirical = [pooled_ecdf(data.prefix(size)) for size in sample_sizes]
 
-
-D_matrix = np.zeros((len(sample_sizes), len(sample_sizes)))
+sup_matrix = sup_distance_matrix(averaged_empirical)
+D_matrix = two_sample_scale(sample_sizes) * sup_matrix
 
 for i, n in enumerate(sample_sizes):
     for j, m in enumerate(sample_sizes):
         if n < m:
-            sup_diff = 0
-            for t in all_points:
-                F_n = averaged_empirical[n][t]
-                F_m = averaged_empirical[m][t]
-                diff = abs(F_n - F_m)
-                if diff > sup_diff:
-                    sup_diff = diff
-
-            D_mn = np.sqrt((n * m) / (m + n)) * sup_diff
-            D_matrix[i, j] = D_mn
-            print(f"D({n},{m}) = {D_mn:.6f} (sup_diff = {sup_diff:.6f})")
+            print(f"D({n},{m}) = {D_matrix[i, j]:.6f} (sup_diff = {sup_matrix[i, j]:.6f})")
 
 print("\nМатрица двухвыборочных статистик:")
 print(" " * 8, end="")
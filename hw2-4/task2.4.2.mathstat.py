@@ -1,27 +1,22 @@
-import json
+from datasets import load_dataset
+from moments import prefix_moments
 
-with open('pareto_series.json', 'r') as f:
-    data = json.load(f)
+data = load_dataset('pareto')
 
-sample_sizes = data['sample_sizes']
-series = data['series']
+sample_sizes = data.sample_sizes
 
-for size in sample_sizes:
+# выборки — префиксы одной серии: X̄ и S² для всех объёмов сразу за один проход
+all_x_bars, all_s_squares = prefix_moments(data.prefix(max(sample_sizes)), sample_sizes)
+
+for size_idx, size in enumerate(sample_sizes):
     print(f"\nОбъем выборки n = {size}:")
 
-    x_bars = []  # выборочные средние
-    s_squares = []  # выборочные дисперсии
+    x_bars = all_x_bars[:, size_idx]  # выборочные средние
+    s_squares = all_s_squares[:, size_idx]  # выборочные дисперсии
 
-    for i, series_data in enumerate(series, 1):
-        sample = series_data['samples'][str(size)]
-        n = len(sample)
-        x_bar = sum(sample) / n
-        squared_deviations = sum((x - x_bar) ** 2 for x in sample)
-        s_squared = squared_deviations / n
-        x_bars.append(x_bar)
-        s_squares.append(s_squared)
+    for i, (x_bar, s_squared) in enumerate(zip(x_bars, s_squares), 1):
         print(f"  Серия {i}: X̄ = {x_bar:.6f}, S̄² = {s_squared:.6f}")
 
-    avg_x_bar = sum(x_bars) / len(x_bars)
-    avg_s_squared = sum(s_squares) / len(s_squares)
+    avg_x_bar = x_bars.mean()
+    avg_s_squared = s_squares.mean()
     print(f"  Среднее: X̄ = {avg_x_bar:.6f}, S̄² = {avg_s_squared:.6f}")
\ No newline at end of file
@@ -1,117 +1,123 @@
+import argparse
 import json
-import math
 import numpy as np
 
-with open('discrete_uniform_series.json', 'r') as f:
-    discrete_data = json.load(f)
+from datasets import load_dataset
+from estimators import estimate_series_set, jackknife_series_set
+from result_cache import cached_result
 
-with open('pareto_series.json', 'r') as f:
-    pareto_data = json.load(f)
+parser = argparse.ArgumentParser(description="Оценки θ методом моментов и ММП (задание 3.1)")
+parser.add_argument('--jackknife', action='store_true',
+                    help="добавить оценки с поправкой на смещение и стандартные ошибки складного ножа")
+args = parser.parse_args()
 
+discrete_data = load_dataset('discrete_uniform')
 
-def estimate_discrete_uniform(sample):
+pareto_data = load_dataset('pareto')
 
-    sample = np.array(sample)
-    n = len(sample)
-    mean_val = np.mean(sample)
-    theta_mm = 2 * mean_val - 1
-    theta_mle = np.max(sample)
 
-    return theta_mm, theta_mle
+def rounded(value):
+    # NaN — оценка не существует, в JSON это null
+    return float(round(value, 6)) if np.isfinite(value) else None
 
 
-def estimate_pareto(sample):
+def format_estimate(value):
+    return f"{value:10.6f}" if value is not None else f"{'не опр.':>10}"
 
-    sample = np.array(sample)
-    n = len(sample)
-    mean_val = np.mean(sample)
-    if mean_val > 1:
-        theta_mm = mean_val / (mean_val - 1)
-    else:
-        theta_mm = float('inf')
 
-    log_sum = np.sum(np.log(sample))
-    if log_sum > 0:
-        theta_mle = n / log_sum
-    else:
-        theta_mle = float('inf')
+def collect_results(data, estimates, jackknife=None):
+    results = {}
+    for series_idx in range(data.num_series):
+        series_num = series_idx + 1
+        print(f"\nСЕРИЯ {series_num}:")
+        print("-" * 40)
 
-    return theta_mm, theta_mle
+        series_results = {}
 
+        for size_idx, size in enumerate(data.sample_sizes):
+            theta_mm = rounded(estimates['MM'][series_idx, size_idx])
+            theta_mle = rounded(estimates['MLE'][series_idx, size_idx])
 
-print("=" * 70)
-print("ДИСКРЕТНОЕ РАВНОМЕРНОЕ РАСПРЕДЕЛЕНИЕ (θ = 121)")
-print("=" * 70)
-
-results_discrete = {}
-
-for series in discrete_data['series']:
-    series_num = series['series_number']
-    print(f"\nСЕРИЯ {series_num}:")
-    print("-" * 40)
+            series_results[size] = {
+                'MM': theta_mm,
+                'MLE': theta_mle
+            }
 
-    series_results = {}
+            print(f"  n = {size:4d}:  θ_MM = {format_estimate(theta_mm)},  θ_ММП = {format_estimate(theta_mle)}")
 
-    for size_str, sample in series['samples'].items():
-        size = int(size_str)
-        theta_mm, theta_mle = estimate_discrete_uniform(sample)
-        theta_mm = float(round(theta_mm, 6))
-        theta_mle = float(round(theta_mle, 6))
+            if jackknife is not None:
+                corrected, variance = jackknife
+                for name, label in (('MM', 'θ_MM'), ('MLE', 'θ_ММП')):
+                    value = rounded(corrected[name][series_idx, size_idx])
+                    se = rounded(np.sqrt(variance[name][series_idx, size_idx]))
+                    series_results[size][f'{name}_jackknife'] = value
+                    series_results[size][f'{name}_jackknife_se'] = se
+                    print(f"{'':12}{label} (нож) = {format_estimate(value)} ± {format_estimate(se)}")
 
-        series_results[size] = {
-            'MM': theta_mm,
-            'MLE': theta_mle
-        }
+        results[series_num] = series_results
+    return results
 
-        print(f"  n = {size:4d}:  θ_MM = {theta_mm:10.6f},  θ_ММП = {theta_mle:10.6f}")
 
-    results_discrete[series_num] = series_results
+def print_averages(data, estimates):
+    for size_idx, size in enumerate(data.sample_sizes):
+        # как и в таблице по сериям, усредняются округлённые значения
+        mm_vals = np.round(estimates['MM'][:, size_idx], 6)
+        mle_vals = np.round(estimates['MLE'][:, size_idx], 6)
+        # усредняем только по сериям, где существуют обе оценки
+        valid = np.isfinite(mm_vals) & np.isfinite(mle_vals)
 
-print("\n" + "=" * 70)
-print("РАСПРЕДЕЛЕНИЕ ПАРЕТО (θ = 12)")
-print("=" * 70)
+        if valid.any():
+            avg_mm = np.mean(mm_vals[valid])
+            avg_mle = np.mean(mle_vals[valid])
+            print(f"  n = {size:4d}:  θ_MM = {avg_mm:10.6f},  θ_ММП = {avg_mle:10.6f}")
+        else:
+            print(f"  n = {size:4d}:  оценки не существуют для некоторых серий")
 
-results_pareto = {}
 
-for series in pareto_data['series']:
-    series_num = series['series_number']
-    print(f"\nСЕРИЯ {series_num}:")
-    print("-" * 40)
+@cached_result
+def compute_estimates(name, jackknife=False):
+    # все серии и объёмы одним вызовом: массивы (серии × объёмы);
+    # складной нож — оценки без одного наблюдения за один линейный проход на префикс
+    data = load_dataset(name)
+    return estimate_series_set(data), jackknife_series_set(data) if jackknife else None
 
-    series_results = {}
 
-    for size_str, sample in series['samples'].items():
-        size = int(size_str)
-        theta_mm, theta_mle = estimate_pareto(sample)
+estimates_discrete, jackknife_discrete = compute_estimates('discrete_uniform', jackknife=args.jackknife)
+estimates_pareto, jackknife_pareto = compute_estimates('pareto', jackknife=args.jackknife)
 
-        theta_mm = float(round(theta_mm, 6)) if theta_mm != float('inf') else '∞'
-        theta_mle = float(round(theta_mle, 6)) if theta_mle != float('inf') else '∞'
+print("=" * 70)
+print(f"ДИСКРЕТНОЕ РАВНОМЕРНОЕ РАСПРЕДЕЛЕНИЕ (θ = {discrete_data.theta})")
+print("=" * 70)
 
-        series_results[size] = {
-            'MM': theta_mm,
-            'MLE': theta_mle
-        }
+results_discrete = collect_results(discrete_data, estimates_discrete, jackknife_discrete)
 
-        if theta_mm != '∞' and theta_mle != '∞':
-            print(f"  n = {size:4d}:  θ_MM = {theta_mm:10.6f},  θ_ММП = {theta_mle:10.6f}")
-        else:
-            print(f"  n = {size:4d}:  θ_MM = {theta_mm:>10},  θ_ММП = {theta_mle:>10}")
+print("\n" + "=" * 70)
+print(f"РАСПРЕДЕЛЕНИЕ ПАРЕТО (θ = {pareto_data.theta})")
+print("=" * 70)
 
-    results_pareto[series_num] = series_results
+results_pareto = collect_results(pareto_data, estimates_pareto, jackknife_pareto)
 
 all_results = {
     'discrete_uniform': {
-        'parameter': discrete_data['parameter'],
+        'parameter': discrete_data.theta,
         'estimates': results_discrete
     },
     'pareto': {
-        'parameter': pareto_data['parameter'],
+        'parameter': pareto_data.theta,
         'estimates': results_pareto
     }
 }
 
-with open('parameter_estimates.json', 'w') as f:
-    json.dump(all_results, f, indent=2)
+# файл переписывается, только если результаты изменились
+results_text = json.dumps(all_results, indent=2)
+try:
+    with open('parameter_estimates.json', 'r') as f:
+        unchanged = f.read() == results_text
+except FileNotFoundError:
+    unchanged = False
+if not unchanged:
+    with open('parameter_estimates.json', 'w') as f:
+        f.write(results_text)
 
 print("\n" + "=" * 70)
 print("РЕЗУЛЬТАТЫ СОХРАНЕНЫ")
@@ -122,43 +128,13 @@ print("правдоподобия (θ_ММП).")
 print("\nВсе результаты сохранены в файл 'parameter_estimates.json'")
 
 print("\n" + "=" * 70)
-print("СРЕДНИЕ ЗНАЧЕНИЯ ОЦЕНОК ПО 5 СЕРИЯМ")
+print(f"СРЕДНИЕ ЗНАЧЕНИЯ ОЦЕНОК ПО {discrete_data.num_series} СЕРИЯМ")
 print("=" * 70)
 
 print("\nДискретное равномерное распределение:")
 print("-" * 40)
-for size in discrete_data['sample_sizes']:
-    mm_vals = []
-    mle_vals = []
-
-    for series_num in range(1, 6):
-        mm_val = results_discrete[series_num][size]['MM']
-        mle_val = results_discrete[series_num][size]['MLE']
-        mm_vals.append(mm_val)
-        mle_vals.append(mle_val)
-
-    avg_mm = np.mean(mm_vals)
-    avg_mle = np.mean(mle_vals)
-
-    print(f"  n = {size:4d}:  θ_MM = {avg_mm:10.6f},  θ_ММП = {avg_mle:10.6f}")
+print_averages(discrete_data, estimates_discrete)
 
 print("\nРаспределение Парето:")
 print("-" * 40)
-for size in pareto_data['sample_sizes']:
-    mm_vals = []
-    mle_vals = []
-
-    for series_num in range(1, 6):
-        mm_val = results_pareto[series_num][size]['MM']
-        mle_val = results_pareto[series_num][size]['MLE']
-
-        if mm_val != '∞' and mle_val != '∞':
-            mm_vals.append(mm_val)
-            mle_vals.append(mle_val)
-
-    if mm_vals and mle_vals:
-        avg_mm = np.mean(mm_vals)
-        avg_mle = np.mean(mle_vals)
-        print(f"  n = {size:4d}:  θ_MM = {avg_mm:10.6f},  θ_ММП = {avg_mle:10.6f}")
-    else:
-        print(f"  n = {size:4d}:  оценки не существуют для некоторых серий")
\ No newline at end of file
+print_averages(pareto_data, estimates_pareto)
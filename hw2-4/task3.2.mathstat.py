@@ -1,74 +1,41 @@
-import json
 import numpy as np
 
+from datasets import load_dataset
+from estimators import discrete_uniform_umvu, estimate_series_set
 
-def estimate_theta_uniform_optimal(sample):
-    n = len(sample)
-    X_max = np.max(sample)
+# как в задании: до этого объёма точная формула, дальше — асимптотика (n + 1) / n * X_max
+UMVU_EXACT_MAX_N = 10
 
-    if X_max == 1:
-        return 1.0
 
-    if n >= 10:
-        return ((n + 1) / n) * X_max
-
-    try:
-        numerator = X_max ** (n + 1) - (X_max - 1) ** (n + 1)
-        denominator = X_max ** n - (X_max - 1) ** n
-        result = numerator / denominator
-        return result if not np.isnan(result) else ((n + 1) / n) * X_max
-    except:
-        return ((n + 1) / n) * X_max
-
-
-def estimate_theta_pareto_optimal(sample):
-    n = len(sample)
-    if n <= 1:
-        return np.nan
-    sum_log = np.sum(np.log(sample))
-    if sum_log <= 0:
-        return np.nan
-    return (n - 1) / sum_log
-
-
-def load_samples(filename):
-    with open(filename, 'r') as f:
-        data = json.load(f)
-    return data
+def discrete_uniform_umvu_asymptotic(x_max, n):
+    return np.where(n >= UMVU_EXACT_MAX_N, (n + 1) / n * x_max, discrete_uniform_umvu(x_max, n))
 
 
 def compute_optimal_estimates():
-    uniform_data = load_samples('discrete_uniform_series.json')
-    pareto_data = load_samples('pareto_series.json')
+    uniform_data = load_dataset('discrete_uniform')
+    pareto_data = load_dataset('pareto')
 
-    sample_sizes = uniform_data['sample_sizes']
-    num_series = uniform_data['num_series']
+    sample_sizes = uniform_data.sample_sizes
+    num_series = uniform_data.num_series
+
+    # оптимальные оценки для всех серий и объёмов сразу, NaN — оценка не определена
+    uniform_estimates = discrete_uniform_umvu_asymptotic(estimate_series_set(uniform_data)['MLE'],
+                                                         np.array(sample_sizes))
+    pareto_estimates = estimate_series_set(pareto_data)['UMVU']
 
     uniform_results = []
     pareto_results = []
 
-    for size in sample_sizes:
+    for size_idx, size in enumerate(sample_sizes):
         uniform_row = {'n': size}
         pareto_row = {'n': size}
 
-        uniform_estimates = []
-        pareto_estimates = []
-
         for series_idx in range(num_series):
-            uniform_sample = uniform_data['series'][series_idx]['samples'][str(size)]
-            pareto_sample = pareto_data['series'][series_idx]['samples'][str(size)]
-
-            uniform_est = estimate_theta_uniform_optimal(uniform_sample)
-            pareto_est = estimate_theta_pareto_optimal(pareto_sample)
-
-            uniform_estimates.append(uniform_est)
-            pareto_estimates.append(pareto_est)
-
-            uniform_row[f'Серия {series_idx + 1}'] = uniform_est
-            pareto_row[f'Серия {series_idx + 1}'] = pareto_est
+            uniform_row[f'Серия {series_idx + 1}'] = uniform_estimates[series_idx, size_idx]
+            pareto_row[f'Серия {series_idx + 1}'] = pareto_estimates[series_idx, size_idx]
 
-        uniform_row['Среднее'] = np.mean(uniform_estimates)
-        pareto_row['Среднее'] = np.mean(pareto_estimates)
+        uniform_row['Среднее'] = np.mean(uniform_estimates[:, size_idx])
+        pareto_row['Среднее'] = np.mean(pareto_estimates[:, size_idx])
 
         uniform_results.append(uniform_row)
         pareto_results.append(pareto_row)
@@ -1,68 +1,64 @@
-import json
 import numpy as np
 
+from datasets import load_dataset
+from distributions import Pareto
+from kolmogorov import one_sample_matrix
+from result_cache import cached_result
+from stat_tables import kolmogorov_criterion, kolmogorov_pvalue
 
-def load_pareto_samples():
-    with open('pareto_series.json', 'r') as f:
-        data = json.load(f)
-    return data
-
-
-def kolmogorov_statistic(sample, theta=12):
-    n = len(sample)
-
-    def pareto_cdf(x):
-        return 1 - x ** (-theta)
-
-    x_sorted = np.sort(sample)
-    i = np.arange(1, n + 1)
-    F_n = i / n
-    F = pareto_cdf(x_sorted)
-
-    D_plus = np.max(np.abs(F_n - F))
-    D_minus = np.max(np.abs(F - (i - 1) / n))
-    D_n = max(D_plus, D_minus)
-
-    return D_n
 
+def load_pareto_samples():
+    return load_dataset('pareto')
 
-def perform_kolmogorov_tests():
-    data = load_pareto_samples()
-    sample_sizes = data['sample_sizes']
-    num_series = data['num_series']
-    theta_true = data['parameter']
 
+@cached_result
+def compute_results(name, alpha):
+    data = load_dataset(name)
+    # D_n и S для всех серий и объёмов одним вызовом: массивы (серии × объёмы)
+    stats = one_sample_matrix(data.prefix(max(data.sample_sizes)), data.sample_sizes, Pareto(data.theta).cdf)
+    # при малых n p-значение точное, иначе по предельному распределению S
+    p_values = kolmogorov_pvalue(stats['D_n'], data.sample_sizes)
     results = []
-
-    print("КРИТЕРИЙ КОЛМОГОРОВА ДЛЯ РАСПРЕДЕЛЕНИЯ ПАРЕТО")
-    print(f"θ={theta_true}, α=0.05, крит.знач.=1.358")
-    print("=" * 80)
-
-    for size in sample_sizes:
-        for series_idx in range(num_series):
-            sample = data['series'][series_idx]['samples'][str(size)]
-
-            D_n = kolmogorov_statistic(sample, theta_true)
-            S = (6 * size * D_n + 1) / (6 * np.sqrt(size))
-            reject = S > 1.358
+    for size_idx, size in enumerate(data.sample_sizes):
+        for series_idx in range(data.num_series):
+            D_n = stats['D_n'][series_idx, size_idx]
+            S = stats['S'][series_idx, size_idx]
+            p_value = p_values[series_idx, size_idx]
+            reject = p_value < alpha
 
             results.append({
                 'n': size,
                 'Серия': series_idx + 1,
                 'D_n': D_n,
                 'S': S,
+                'p': p_value,
                 'Отклоняем': reject
             })
+    return results
+
+
+def perform_kolmogorov_tests():
+    data = load_pareto_samples()
+    sample_sizes = data.sample_sizes
+    theta_true = data.theta
+
+    print("КРИТЕРИЙ КОЛМОГОРОВА ДЛЯ РАСПРЕДЕЛЕНИЯ ПАРЕТО")
+    alpha = 0.05
+    print(f"θ={theta_true}, α={alpha}")
+    print("=" * 80)
+
+    results = compute_results('pareto', alpha)
 
     for size in sample_sizes:
-        print(f"\nn = {size}:")
-        print(f"{'Серия':<8} {'D_n':<12} {'S':<12} {'Вывод':<15}")
-        print("-" * 50)
+        statistic, critical_value = kolmogorov_criterion(alpha, size)
+        print(f"\nn = {size}: крит.знач. для {statistic} = {critical_value:.4f}")
+        print(f"{'Серия':<8} {'D_n':<12} {'S':<12} {'p-значение':<12} {'Вывод':<15}")
+        print("-" * 63)
 
         for result in results:
             if result['n'] == size:
                 status = "ОТКЛОНЯЕМ" if result['Отклоняем'] else "ПРИНИМАЕМ"
-                print(f"{result['Серия']:<8} {result['D_n']:<12.6f} {result['S']:<12.6f} {status:<15}")
+                print(f"{result['Серия']:<8} {result['D_n']:<12.6f} {result['S']:<12.6f} {result['p']:<12.6f} {status:<15}")
 
     print("\n" + "=" * 80)
     print("СРЕДНИЕ ЗНАЧЕНИЯ ПО РАЗМЕРАМ ВЫБОРОК:")
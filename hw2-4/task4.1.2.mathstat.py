@@ -1,12 +1,10 @@
-import json
 import numpy as np
-from scipy.stats import chi2
 
-
-def load_samples(filename):
-    with open(filename, 'r') as f:
-        data = json.load(f)
-    return data
+from datasets import load_dataset
+from distributions import DiscreteUniform
+from frequencies import DiscreteFrequencies
+from result_cache import cached_result
+from stat_tables import chi2_critical, chi2_pvalue
 
 
 def sturges_k(n):
@@ -27,18 +25,12 @@ def create_intervals(k, theta):
 
 
 def chi2_statistic(sample, intervals, n, theta):
-    observed = [0] * len(intervals)
-    for value in sample:
-        for idx, (low, high) in enumerate(intervals):
-            if low <= value <= high:
-                observed[idx] += 1
-                break
-
-    expected = []
-    for low, high in intervals:
-        length = high - low + 1
-        prob = length / theta
-        expected.append(n * prob)
+    observed = DiscreteFrequencies(sample, theta).interval_counts(intervals)
+
+    # P(low <= X <= high) = F(high + 1) - F(low), F(t) = P(X < t)
+    lows, highs = np.array(intervals).T
+    cdf = DiscreteUniform(theta).cdf
+    expected = n * (cdf(highs + 1) - cdf(lows))
 
     chi2_val = 0
     for obs, exp in zip(observed, expected):
@@ -47,11 +39,11 @@ def chi2_statistic(sample, intervals, n, theta):
     return chi2_val
 
 
-def main():
-    data = load_samples('discrete_uniform_series.json')
-    theta = data['parameter']
-    sample_sizes = data['sample_sizes']
-    series = data['series']
+@cached_result
+def compute_results(name, alpha):
+    data = load_dataset(name)
+    theta = data.theta
+    sample_sizes = data.sample_sizes
 
     results = []
 
@@ -62,11 +54,12 @@ def main():
         k = sturges_k(size)
         intervals = create_intervals(k, theta)
         df = k - 1
-        critical_value = chi2.ppf(0.95, df)
+        critical_value = chi2_critical(df, alpha)
 
-        for series_idx, series_data in enumerate(series):
-            sample = series_data['samples'][str(size)]
+        for series_idx in range(data.num_series):
+            sample = data.sample(series_idx, size)
             chi2_val = chi2_statistic(sample, intervals, size, theta)
+            p_value = chi2_pvalue(chi2_val, df)
             conclusion = "Отвергаем" if chi2_val > critical_value else "Принимаем"
 
             results.append({
@@ -75,14 +68,23 @@ def main():
                 'k_интервалов': k,
                 'χ2': round(chi2_val, 2),
                 'Критическое': round(critical_value, 2),
+                'p': p_value,
                 'Вывод': conclusion
             })
+    return results
+
+
+def main():
+    data = load_dataset('discrete_uniform')
+    sample_sizes = data.sample_sizes
+
+    results = compute_results('discrete_uniform', 0.05)
 
-    print("n\tСерия\tk\tχ2\t\tКрит.зн.\tВывод")
+    print("n\tСерия\tk\tχ2\t\tКрит.зн.\tp-значение\tВывод")
     print("-" * 60)
     for res in results:
         print(
-            f"{res['n']}\t{res['Серия']}\t{res['k_интервалов']}\t{res['χ2']:8.2f}\t{res['Критическое']:8.2f}\t{res['Вывод']}")
+            f"{res['n']}\t{res['Серия']}\t{res['k_интервалов']}\t{res['χ2']:8.2f}\t{res['Критическое']:8.2f}\t{res['p']:10.4f}\t{res['Вывод']}")
 
     summary = {}
     for size in sample_sizes:
@@ -1,22 +1,15 @@
-import json
 import numpy as np
-from scipy.stats import chi2
 
-
-def load_samples(filename):
-    with open(filename, 'r') as f:
-        data = json.load(f)
-    return data
+from datasets import load_dataset
+from distributions import Pareto
+from result_cache import cached_result
+from stat_tables import chi2_critical, chi2_pvalue
 
 
 def sturges_k(n):
     return max(2, 1 + int(np.log2(n)))
 
 
-def pareto_cdf(x, theta):
-    return 1 - x ** (-theta)
-
-
 def create_intervals_pareto(sample, k, theta):
     sorted_sample = sorted(sample)
     min_val = 1.0
@@ -24,9 +17,7 @@ def create_intervals_pareto(sample, k, theta):
 
     probs = np.linspace(0, 1, k + 1)[1:-1]
     boundaries = [min_val]
-    for p in probs:
-        boundary = (1 - p) ** (-1 / theta)
-        boundaries.append(boundary)
+    boundaries.extend(Pareto(theta).ppf(probs))
     boundaries.append(max_val)
 
     return boundaries
@@ -45,10 +36,7 @@ def chi2_statistic_pareto(sample, boundaries, theta):
             observed[-1] += 1
 
     n = len(sample)
-    expected = np.zeros(k)
-    for i in range(k):
-        prob = pareto_cdf(boundaries[i + 1], theta) - pareto_cdf(boundaries[i], theta)
-        expected[i] = n * prob
+    expected = n * np.diff(Pareto(theta).cdf(boundaries))
 
     chi2_val = 0
     for obs, exp in zip(observed, expected):
@@ -57,23 +45,24 @@ def chi2_statistic_pareto(sample, boundaries, theta):
     return chi2_val
 
 
-def main():
-    data = load_samples('pareto_series.json')
-    theta = data['parameter']
-    sample_sizes = data['sample_sizes']
-    series = data['series']
+@cached_result
+def compute_results(name, alpha):
+    data = load_dataset(name)
+    theta = data.theta
+    sample_sizes = data.sample_sizes
 
     results = []
 
     for size in sample_sizes:
         k = sturges_k(size)
         df = k - 1
-        critical_value = chi2.ppf(0.95, df)
+        critical_value = chi2_critical(df, alpha)
 
-        for series_idx, series_data in enumerate(series):
-            sample = series_data['samples'][str(size)]
+        for series_idx in range(data.num_series):
+            sample = data.sample(series_idx, size)
             boundaries = create_intervals_pareto(sample, k, theta)
             chi2_val = chi2_statistic_pareto(sample, boundaries, theta)
+            p_value = chi2_pvalue(chi2_val, df)
             conclusion = "Отвергаем" if chi2_val > critical_value else "Принимаем"
 
             results.append({
@@ -82,14 +71,23 @@ def main():
                 'k_интервалов': k,
                 'χ2': round(chi2_val, 2),
                 'Критическое': round(critical_value, 2),
+                'p': p_value,
                 'Вывод': conclusion
             })
+    return results
+
+
+def main():
+    data = load_dataset('pareto')
+    sample_sizes = data.sample_sizes
+
+    results = compute_results('pareto', 0.05)
 
-    print("n\tСерия\tk\tχ2\t\tКрит.зн.\tВывод")
+    print("n\tСерия\tk\tχ2\t\tКрит.зн.\tp-значение\tВывод")
     print("-" * 60)
     for res in results:
         print(
-            f"{res['n']}\t{res['Серия']}\t{res['k_интервалов']}\t{res['χ2']:8.2f}\t{res['Критическое']:8.2f}\t{res['Вывод']}")
+            f"{res['n']}\t{res['Серия']}\t{res['k_интервалов']}\t{res['χ2']:8.2f}\t{res['Критическое']:8.2f}\t{res['p']:10.4f}\t{res['Вывод']}")
 
     summary = {}
     for size in sample_sizes:
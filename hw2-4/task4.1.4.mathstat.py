@@ -1,75 +1,55 @@
-import json
-import math
 import numpy as np
-import random
 
-
-def generate_pareto_sample(theta, sample_size):
-    sample = []
-    for _ in range(sample_size):
-        gamma = random.uniform(0, 1)
-        mu_gamma = (1 - gamma) ** (-1 / theta)
-        sample.append(mu_gamma)
-    return sample
-
-
-def load_samples(filename):
-    with open(filename, 'r') as f:
-        data = json.load(f)
-    return data
+from datasets import load_dataset
+from distributions import Pareto
+from generators import generate_pareto_sample
+from kolmogorov import one_sample_matrix
+from stat_tables import kolmogorov_criterion, kolmogorov_pvalue
 
 
 def estimate_theta(sample):
     n = len(sample)
-    sum_log = sum(math.log(x) for x in sample)
+    sum_log = np.sum(np.log(sample))
     return n / sum_log if sum_log > 0 else 1.0
 
 
-def kolmogorov_statistic(sample, theta_est):
-    n = len(sample)
-    sorted_sample = sorted(sample)
-
-    Dn = 0
-    for i, x in enumerate(sorted_sample, 1):
-        Fn = i / n
-        F_theory = 1 - x ** (-theta_est)
-        diff = abs(Fn - F_theory)
-        if diff > Dn:
-            Dn = diff
-
-    S = (6 * n * Dn + 1) / (6 * math.sqrt(n))
-    return Dn, S
-
-
 def main():
-    data = load_samples('pareto_series.json')
-    sample_sizes = data['sample_sizes']
-    series = data['series']
+    data = load_dataset('pareto')
+    sample_sizes = data.sample_sizes
 
     big_sample = generate_pareto_sample(theta=12, sample_size=10000)
     theta_est = estimate_theta(big_sample)
 
+    # D_n = max(D⁺, D⁻) и S для всех серий и объёмов одним вызовом
+    stats = one_sample_matrix(data.prefix(max(sample_sizes)), sample_sizes, Pareto(theta_est).cdf)
+    p_values = kolmogorov_pvalue(stats['D_n'], sample_sizes)
+    alpha = 0.05
+
     results = []
 
-    for size in sample_sizes:
-        for series_idx, series_data in enumerate(series):
-            sample = series_data['samples'][str(size)]
-            Dn, S = kolmogorov_statistic(sample, theta_est)
-            conclusion = "Отвергаем" if S > 1.358 else "Принимаем"
+    for size_idx, size in enumerate(sample_sizes):
+        for series_idx in range(data.num_series):
+            Dn = stats['D_n'][series_idx, size_idx]
+            S = stats['S'][series_idx, size_idx]
+            p_value = p_values[series_idx, size_idx]
+            conclusion = "Отвергаем" if p_value < alpha else "Принимаем"
+            # при малых n точное распределение D_n, иначе предельное для S
+            statistic, critical_value = kolmogorov_criterion(alpha, size)
 
             results.append({
                 'n': size,
                 'Серия': series_idx + 1,
                 'Dn': round(Dn, 6),
                 'S': round(S, 6),
-                'Критическое': 1.358,
+                'Критическое': f"{statistic}: {critical_value:.4f}",
+                'p': p_value,
                 'Вывод': conclusion
             })
 
-    print("n\tСерия\tDn\t\tS\t\tКрит.\tВывод")
-    print("-" * 70)
+    print("n\tСерия\tDn\t\tS\t\tКрит.\t\tp-значение\tВывод")
+    print("-" * 80)
     for res in results:
-        print(f"{res['n']}\t{res['Серия']}\t{res['Dn']:.6f}\t{res['S']:.6f}\t{res['Критическое']}\t{res['Вывод']}")
+        print(f"{res['n']}\t{res['Серия']}\t{res['Dn']:.6f}\t{res['S']:.6f}\t{res['Критическое']}\t{res['p']:.6f}\t{res['Вывод']}")
 
     summary = {}
     for size in sample_sizes:
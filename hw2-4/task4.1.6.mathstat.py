@@ -1,12 +1,10 @@
-import json
 import numpy as np
-from scipy.stats import chi2
 
-
-def load_samples(filename):
-    with open(filename, 'r') as f:
-        data = json.load(f)
-    return data
+from datasets import load_dataset
+from distributions import DiscreteUniform
+from frequencies import DiscreteFrequencies
+from result_cache import cached_result
+from stat_tables import chi2_critical, chi2_pvalue
 
 
 def sturges_k(n):
@@ -30,7 +28,7 @@ def create_intervals_discrete(k, theta_est):
     return intervals
 
 
-def chi2_complex_discrete(sample):
+def chi2_complex_discrete(sample, alpha=0.05):
     n = len(sample)
 
     theta_est = estimate_theta_discrete(sample)
@@ -39,18 +37,12 @@ def chi2_complex_discrete(sample):
 
     intervals = create_intervals_discrete(k, theta_est)
 
-    observed = np.zeros(k)
-    for value in sample:
-        for idx, (low, high) in enumerate(intervals):
-            if low <= value <= high:
-                observed[idx] += 1
-                break
+    observed = DiscreteFrequencies(sample, theta_est).interval_counts(intervals)
 
-    expected = np.zeros(k)
-    for idx, (low, high) in enumerate(intervals):
-        length = high - low + 1
-        prob = length / theta_est
-        expected[idx] = n * prob
+    # P(low <= X <= high) = F(high + 1) - F(low), F(t) = P(X < t)
+    lows, highs = np.array(intervals).T
+    cdf = DiscreteUniform(theta_est).cdf
+    expected = n * (cdf(highs + 1) - cdf(lows))
 
     chi2_val = 0
     for obs, exp in zip(observed, expected):
@@ -58,15 +50,16 @@ def chi2_complex_discrete(sample):
             chi2_val += (obs - exp) ** 2 / exp
 
     df = k - 2
-    critical_value = chi2.ppf(0.95, df)
+    critical_value = chi2_critical(df, alpha)
+    p_value = chi2_pvalue(chi2_val, df)
 
-    return chi2_val, critical_value, k, theta_est, df
+    return chi2_val, critical_value, p_value, k, theta_est, df
 
 
-def main():
-    data = load_samples('discrete_uniform_series.json')
-    sample_sizes = data['sample_sizes']
-    series = data['series']
+@cached_result
+def compute_results(name, alpha):
+    data = load_dataset(name)
+    sample_sizes = data.sample_sizes
 
     results = []
     theta_estimates = {}
@@ -76,10 +69,10 @@ def main():
             continue
 
         size_theta_estimates = []
-        for series_idx, series_data in enumerate(series):
-            sample = series_data['samples'][str(size)]
+        for series_idx in range(data.num_series):
+            sample = data.sample(series_idx, size)
 
-            chi2_val, critical_value, k, theta_est, df = chi2_complex_discrete(sample)
+            chi2_val, critical_value, p_value, k, theta_est, df = chi2_complex_discrete(sample, alpha)
 
             conclusion = "Отвергаем" if chi2_val > critical_value else "Принимаем"
 
@@ -90,6 +83,7 @@ def main():
                 'θ_est': theta_est,
                 'χ2': round(chi2_val, 2),
                 'Критическое': round(critical_value, 2),
+                'p': p_value,
                 'df': df,
                 'Вывод': conclusion
             })
@@ -97,12 +91,20 @@ def main():
             size_theta_estimates.append(theta_est)
 
         theta_estimates[size] = np.mean(size_theta_estimates)
+    return results, theta_estimates
+
+
+def main():
+    data = load_dataset('discrete_uniform')
+    sample_sizes = data.sample_sizes
+
+    results, theta_estimates = compute_results('discrete_uniform', 0.05)
 
-    print("n\tСерия\tk\tθ_est\tχ2\t\tКрит.зн.\tdf\tВывод")
+    print("n\tСерия\tk\tθ_est\tχ2\t\tКрит.зн.\tp-значение\tdf\tВывод")
     print("-" * 80)
     for res in results:
         print(
-            f"{res['n']}\t{res['Серия']}\t{res['k']}\t{res['θ_est']}\t{res['χ2']:8.2f}\t{res['Критическое']:8.2f}\t{res['df']}\t{res['Вывод']}")
+            f"{res['n']}\t{res['Серия']}\t{res['k']}\t{res['θ_est']}\t{res['χ2']:8.2f}\t{res['Критическое']:8.2f}\t{res['p']:10.4f}\t{res['df']}\t{res['Вывод']}")
 
     print("\nСредние оценки θ по объему выборки:")
     print("n\tСреднее θ")